@@ -0,0 +1,205 @@
+"""
+Cold-start benchmark: import time of lambda_function and first-invocation
+latency per event type, each sample in a fresh interpreter.
+
+Scenarios cover the early returns (empty body, ignored event) and the
+network paths (auto diagnosis start, poll.rundeck). On network paths the
+real boto3 clients and requests sessions are still built, so their import
+and construction cost is measured, but calls are answered by in-process
+fixtures and nothing leaves the machine.
+
+    python benchmarks/bench_cold_start.py                      # 20 samples per scenario
+    python benchmarks/bench_cold_start.py --samples 50 --scenarios empty_body,auto_diagnosis
+    python benchmarks/bench_cold_start.py --json cold_start.json
+
+Reports min / p50 / p90 / p99 for import, first invocation and their sum,
+plus the heavy modules loaded by the end of the invocation.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("requests", "urllib3", "boto3", "botocore", "ast")
+
+
+def _event(evt_type: str, **data) -> dict:
+    d = {"id": "INC1", "title": "bench", "custom_fields": []}
+    d.update(data)
+    return {"body": json.dumps({"event": {"type": evt_type}, "data": d})}
+
+
+SCENARIOS = {
+    "empty_body": lambda: {"body": ""},
+    "ignored_event": lambda: _event("incident.updated"),
+    "auto_diagnosis": lambda: _event("incident.created", custom_fields=[
+        {"custom_field": {"slug": "watch_id"}, "value": "slo_a"},
+        {"custom_field": {"slug": "environment_orn"}, "value": "orn:bench"},
+    ]),
+    "poll_rundeck": lambda: _event("poll.rundeck", execution_id="77", mode="diagnosis",
+                                   selector="auto:watch:slo_a", job_id="JOBD"),
+}
+
+CHILD_ENV = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+    "ROOTLY_API_TOKEN": "bench",
+    "RUNDECK_API_TOKEN_Dev": "bench",
+    "RUNDECK_URL": "https://rundeck.invalid/api/45",
+    "ASYNC_POLL_LAMBDA_NAME": "bench-poller",
+    "WATCH_TO_DIAG_MAP": '{"slo_a": "JOBD"}',
+    "POLL_ADAPTIVE": "false",
+    "POLLING_INTERVAL": "0",
+}
+
+
+# =========================
+# Child side (fresh interpreter per sample)
+# =========================
+class _FixtureResponse:
+    def __init__(self, status: int, payload):
+        self.status_code = status
+        self._payload = payload
+        self.text = json.dumps(payload)
+        self.headers = {}
+        self.ok = status < 400
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FixtureSession:
+    def __init__(self, upstream: str):
+        self.upstream = upstream
+
+    def request(self, method: str, url: str, **kw):
+        if self.upstream == "rundeck":
+            if url.endswith("/run"):
+                return _FixtureResponse(200, {"id": 77})
+            if "/output" in url:
+                return _FixtureResponse(200, {"entries": [{"log": "Cloud Account ID:"}, {"log": "123"}],
+                                              "completed": True, "execCompleted": True,
+                                              "execState": "succeeded", "offset": 40})
+            return _FixtureResponse(200, {"completed": True, "executionState": "SUCCEEDED"})
+        if method == "GET" and "/form_fields?" in url:
+            return _FixtureResponse(200, {"data": [{"id": "F1"}]})
+        if method == "GET":
+            return _FixtureResponse(200, {"data": []})
+        return _FixtureResponse(201, {"data": {"id": "S1"}})
+
+    def get(self, url, **kw):
+        return self.request("GET", url, **kw)
+
+    def post(self, url, **kw):
+        return self.request("POST", url, **kw)
+
+
+class _FixtureAWS:
+    """Accepts every DynamoDB / Lambda call as a no-op success."""
+
+    def __getattr__(self, op):
+        return lambda **kw: {}
+
+
+def child(scenario: str) -> None:
+    t0 = time.perf_counter()
+    import lambda_function as lf
+    t_import = time.perf_counter() - t0
+
+    real_aws, real_http = lf._aws_client, lf._http_session
+
+    def aws_client(service):
+        real_aws(service)
+        return _FixtureAWS()
+
+    def http_session(upstream, status_forcelist=()):
+        real_http(upstream, status_forcelist)
+        return _FixtureSession(upstream)
+
+    lf._aws_client, lf._http_session = aws_client, http_session
+    event = SCENARIOS[scenario]()
+
+    t1 = time.perf_counter()
+    resp = lf.lambda_handler(event, None)
+    t_first = time.perf_counter() - t1
+
+    print(json.dumps({
+        "import_s": t_import,
+        "first_s": t_first,
+        "status": json.loads(resp["body"]).get("status"),
+        "modules": [m for m in HEAVY_MODULES if m in sys.modules],
+    }))
+
+
+# =========================
+# Parent side
+# =========================
+def _percentile(vals: list, q: float) -> float:
+    s = sorted(vals)
+    return s[max(0, math.ceil(q / 100 * len(s)) - 1)]
+
+
+def sample(scenario: str) -> dict:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("APPCONFIG_")}
+    env.update(CHILD_ENV)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (ROOT, env.get("PYTHONPATH", "")) if p)
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", scenario],
+                         env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list) -> dict:
+    out = {}
+    for key in ("import_s", "first_s", "total_s"):
+        vals = [s["import_s"] + s["first_s"] if key == "total_s" else s[key] for s in samples]
+        out[key] = {"min": min(vals), "p50": _percentile(vals, 50),
+                    "p90": _percentile(vals, 90), "p99": _percentile(vals, 99)}
+    out["status"] = samples[-1]["status"]
+    out["modules"] = samples[-1]["modules"]
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--samples", type=int, default=20, help="fresh interpreters per scenario")
+    ap.add_argument("--scenarios", default=",".join(SCENARIOS))
+    ap.add_argument("--json", help="also write the summary to this file")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return 0
+
+    report = {}
+    for name in [s for s in args.scenarios.split(",") if s]:
+        if name not in SCENARIOS:
+            ap.error(f"unknown scenario {name!r} (known: {', '.join(SCENARIOS)})")
+        sample(name)  # warm the OS page cache so the first sample is not an outlier
+        summary = summarize([sample(name) for _ in range(max(1, args.samples))])
+        report[name] = summary
+        imp, first, total = summary["import_s"], summary["first_s"], summary["total_s"]
+        print(f"{name:>15}  import p50 {imp['p50'] * 1000:7.1f}ms p99 {imp['p99'] * 1000:7.1f}ms"
+              f"  first p50 {first['p50'] * 1000:7.1f}ms p99 {first['p99'] * 1000:7.1f}ms"
+              f"  total p99 {total['p99'] * 1000:7.1f}ms  [{summary['status']}]"
+              f"  loaded: {','.join(summary['modules']) or '-'}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "samples": args.samples, "scenarios": report},
+                      f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
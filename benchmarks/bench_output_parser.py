@@ -0,0 +1,313 @@
+"""
+Benchmark for Rundeck output parsing (fetch_output / _clean_line /
+_try_parse_single_kv_json) on synthetic Rundeck log fixtures.
+
+Fixtures are deterministic and mix the shapes seen in diagnosis jobs:
+timestamps, ANSI colour noise, JSON-wrapped multi-line values, a KV result
+table, horizontal rules and repeated O11 sections.
+
+For every size it reports throughput, per-stage time and peak memory
+(tracemalloc), compares against the stored baseline and exits non-zero on
+a regression beyond the tolerance.
+
+    python benchmarks/bench_output_parser.py                  # compare to baseline
+    python benchmarks/bench_output_parser.py --sizes 1000,10000
+    python benchmarks/bench_output_parser.py --update-baseline
+
+Stage times are the best over several fresh interpreters (--processes):
+within one process they are stable, but some processes run a uniformly
+~1.5x slower path, which a single process cannot tell from a regression.
+The baseline records --processes/--repeat/--min-time, and a comparison
+run with different settings is refused rather than judged.
+
+Throughput baselines are machine dependent: refresh them with
+--update-baseline when the reference machine changes.
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lambda_function as lf  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_output_parser.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+SECTION_HEADERS = [
+    "Cloud Account ID:",
+    "Cloud Region:",
+    "Frontends of the environment:",
+    "Details for fe-{n} (last 2m)",
+    "Details for app pools, last 15m",
+    "Database of the environment:",
+    "Details for DB {n}",
+    "Details for misc check {n}",
+]
+
+
+def make_entries(n: int, seed: int = 7) -> list:
+    """
+    n Rundeck output entries; the same (n, seed) always yields the same fixture.
+    The KV table comes once, first: the parser drops everything before a
+    table, so tables spread through the log would leave only the text after
+    the last one and the section rendering would go unmeasured.
+    """
+    r = random.Random(seed)
+    out = []
+
+    def add(line: str):
+        if r.random() < 0.7:
+            line = f"{r.randint(0, 23):02d}:{r.randint(0, 59):02d}:{r.randint(0, 59):02d} {line}"
+        out.append({"log": line, "level": "NORMAL"})
+
+    add("key value data: results")
+    add("Key")
+    add("Value")
+    for i in range(12):
+        add(f"metric_{i}      {r.randint(0, 10**6)}    value text {r.randint(0, 50)}")
+    add("-" * r.randint(3, 30))
+    while len(out) < n:
+        kind = r.random()
+        if kind < 0.35:
+            header = r.choice(SECTION_HEADERS).format(n=r.randint(0, 20))
+            add(header)
+            for _ in range(r.randint(1, 8)):
+                add(f"  host-{r.randint(0, 99)}  cpu={r.randint(0, 100)}%  mem={r.randint(0, 100)}%")
+            add("")
+        elif kind < 0.5:
+            payload = "\\n".join(f"row {i}: {r.randint(0, 999)}" for i in range(r.randint(1, 6)))
+            add(json.dumps({"output": payload}))
+        elif kind < 0.65:
+            add(f"\x1b[3{r.randint(0, 7)}m[INFO]\x1b[0m step {r.randint(0, 500)} finished")
+        elif kind < 0.7:
+            add("-" * r.randint(3, 40))
+        else:
+            add(f"processing item {r.randint(0, 5000)} status={r.choice(['ok', 'warn', 'err'])}")
+    return out[:n]
+
+
+class _FixtureSession:
+    """Serves the fixture as the Rundeck /output response so fetch_output runs end to end."""
+    def __init__(self, body: dict):
+        self.text = json.dumps(body)
+
+    def get(self, url, **kw):
+        return _FixtureResponse(self.text)
+
+
+class _FixtureResponse:
+    status_code = 200
+    ok = True
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        return None
+
+
+def _timed(fn, *a):
+    gc.collect()
+    t0 = time.perf_counter()
+    res = fn(*a)
+    return res, time.perf_counter() - t0
+
+
+def _peak_bytes(fn, *a) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(*a)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def calibrate(repeat: int = 5) -> float:
+    """
+    Seconds for a fixed pure-Python string workload. Stage times are
+    compared as multiples of this, so a uniformly slower or busier machine
+    does not read as a parser regression.
+    """
+    words = [f"item {i} status=ok" for i in range(20_000)]
+
+    def work():
+        acc = 0
+        for w in words:
+            acc += len(w.strip().lower().split(" ")[-1])
+        return acc
+    return min(_timed(work)[1] for _ in range(repeat))
+
+
+def best_of(fn, repeat: int, min_time: float, max_runs: int = 50) -> float:
+    """
+    Best time over at least `repeat` runs, continuing until `min_time`
+    seconds have been spent (up to max_runs), so fast stages get enough
+    samples for the minimum to be stable.
+    """
+    times, spent = [], 0.0
+    while len(times) < repeat or (spent < min_time and len(times) < max_runs):
+        t = _timed(fn)[1]
+        times.append(t)
+        spent += t
+    return min(times)
+
+
+def bench_size(n: int, repeat: int, min_time: float = 0.5) -> dict:
+    entries = make_entries(n)
+    lines = [e["log"] for e in entries]
+    body = {"entries": entries, "completed": True, "execCompleted": True}
+    payload_mb = len(json.dumps(body)) / 1e6
+
+    client = lf.RundeckClient()
+    client.session = _FixtureSession(body)
+
+    stages = {
+        "clean_line": lambda: [lf._clean_line(x) for x in lines],
+        "kv_json": lambda: [lf._try_parse_single_kv_json(x) for x in lines],
+        "parse": lambda: lf.OUTPUT_PARSER.parse(entries),
+        "fetch_output": lambda: client.fetch_output("bench"),
+    }
+    result = {"entries": n, "payload_mb": round(payload_mb, 3), "stages": {}}
+    for name, fn in stages.items():
+        best = best_of(fn, repeat, min_time)
+        result["stages"][name] = {"seconds": round(best, 5), "entries_per_s": round(n / best if best else 0.0, 1)}
+    out = stages["fetch_output"]()
+    result["output_chars"] = len(out)
+    result["output_sha256"] = hashlib.sha256(out.encode("utf-8")).hexdigest()
+    result["throughput_mb_s"] = round(payload_mb / result["stages"]["fetch_output"]["seconds"], 3)
+    result["peak_mb"] = round(_peak_bytes(stages["fetch_output"]) / 1e6, 3)
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta: float = 0.01) -> list:
+    """
+    Regression messages for stage slowdowns or peak-memory growth beyond
+    tolerance. Slowdowns smaller than min_delta seconds are timer noise.
+    """
+    problems = []
+    scale = 1.0
+    if results.get("calibration_s") and baseline.get("calibration_s"):
+        scale = results["calibration_s"] / baseline["calibration_s"]
+    for size, cur in results.items():
+        base = baseline.get(size)
+        if not isinstance(cur, dict) or not base:
+            continue
+        if base.get("output_sha256") != cur["output_sha256"]:
+            problems.append(f"{size}: output changed (sha256 {str(base.get('output_sha256'))[:12]} -> "
+                            f"{cur['output_sha256'][:12]}, {base.get('output_chars')} -> {cur['output_chars']} chars)")
+        for stage, st in cur["stages"].items():
+            b = (base.get("stages") or {}).get(stage)
+            allowed = b["seconds"] * scale * (1 + tolerance) if b else 0.0
+            if b and st["seconds"] > allowed and st["seconds"] - b["seconds"] * scale > min_delta:
+                problems.append(f"{size} {stage}: {st['seconds']:.4f}s vs baseline {b['seconds']:.4f}s "
+                                f"(machine scale {scale:.2f})")
+        if base.get("peak_mb") and cur["peak_mb"] > base["peak_mb"] * (1 + tolerance):
+            problems.append(f"{size}: peak {cur['peak_mb']}MB vs baseline {base['peak_mb']}MB")
+    return problems
+
+
+def measure(sizes: list, repeat: int, min_time: float) -> dict:
+    lf.Log._logger.disabled = True
+    results: dict = {"calibration_s": round(calibrate(), 5)}
+    for n in sizes:
+        results[str(n)] = bench_size(n, max(1, repeat if n < 1_000_000 else 1), min_time)
+    return results
+
+
+def merge(runs: list) -> dict:
+    """Per-stage best time and lowest peak across processes; outputs must agree."""
+    merged = json.loads(json.dumps(runs[0]))
+    merged["calibration_s"] = min(r["calibration_s"] for r in runs)
+    for size, res in merged.items():
+        if not isinstance(res, dict):
+            continue
+        others = [r[size] for r in runs[1:]]
+        if any(o["output_sha256"] != res["output_sha256"] for o in others):
+            raise RuntimeError(f"{size}: rendered output differs between processes")
+        for stage, st in res["stages"].items():
+            st["seconds"] = min([st["seconds"]] + [o["stages"][stage]["seconds"] for o in others])
+            st["entries_per_s"] = round(res["entries"] / st["seconds"] if st["seconds"] else 0.0, 1)
+        res["peak_mb"] = min([res["peak_mb"]] + [o["peak_mb"] for o in others])
+        res["throughput_mb_s"] = round(res["payload_mb"] / res["stages"]["fetch_output"]["seconds"], 3)
+    return merged
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default=",".join(str(x) for x in DEFAULT_SIZES))
+    ap.add_argument("--repeat", type=int, default=5, help="minimum runs per stage; the best is kept")
+    ap.add_argument("--min-time", type=float, default=0.5,
+                    help="keep repeating a stage until this many seconds were spent (max 50 runs)")
+    ap.add_argument("--tolerance", type=float, default=0.35, help="allowed slowdown / memory growth (0.35 = 35%%)")
+    ap.add_argument("--min-delta", type=float, default=0.01, help="ignore slowdowns below this many seconds")
+    ap.add_argument("--processes", type=int, default=3, help="fresh interpreters to measure in; the best is kept")
+    ap.add_argument("--baseline", default=BASELINE_PATH)
+    ap.add_argument("--update-baseline", action="store_true")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    if args.child:
+        print(json.dumps(measure(sizes, args.repeat, args.min_time)))
+        return 0
+    if args.processes <= 1:
+        results = measure(sizes, args.repeat, args.min_time)
+    else:
+        cmd = [sys.executable, os.path.abspath(__file__), "--child", "--sizes", args.sizes,
+               "--repeat", str(args.repeat), "--min-time", str(args.min_time)]
+        results = merge([json.loads(subprocess.run(cmd, capture_output=True, text=True, check=True)
+                                    .stdout.strip().splitlines()[-1]) for _ in range(args.processes)])
+    for n in sizes:
+        res = results[str(n)]
+        st = res["stages"]
+        print(f"{n:>9} entries  {res['payload_mb']:>8.2f}MB  fetch_output {st['fetch_output']['seconds']:.4f}s "
+            f"({res['throughput_mb_s']:.2f}MB/s)  parse {st['parse']['seconds']:.4f}s  "
+            f"clean_line {st['clean_line']['seconds']:.4f}s  kv_json {st['kv_json']['seconds']:.4f}s  "
+            f"peak {res['peak_mb']:.1f}MB")
+
+    settings = {"processes": max(1, args.processes), "repeat": args.repeat, "min_time": args.min_time}
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        if baseline.get("settings", settings) != settings:
+            baseline = {}  # sizes measured under other settings would not be comparable
+        baseline.update(results)
+        baseline["settings"] = settings
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline stored; run with --update-baseline")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("settings") != settings:
+        print(f"baseline was recorded with {baseline.get('settings')}, this run used {settings}; "
+              f"rerun with the baseline's settings or refresh it with --update-baseline")
+        return 2
+    problems = compare(results, baseline, args.tolerance, args.min_delta)
+    for p in problems:
+        print(f"REGRESSION {p}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,62 @@
 import json
 import os
 import re
+import sys
 import time
 import datetime
 import logging
-import ast
-from typing import Dict, Any, Optional, List, Union
+import math
+import random
+import threading
+import importlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Union, Callable
 
-import requests
-import boto3
-from botocore.exceptions import ClientError
+
+class _LazyModule:
+    """
+    Stand-in for a heavy dependency that is imported on first attribute access,
+    so cold starts on paths that never touch the network skip the import.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr: str):
+        mod = self._mod
+        if mod is None:
+            mod = self._mod = importlib.import_module(self._name)
+        return getattr(mod, attr)
+
+
+requests = _LazyModule("requests")
+boto3 = _LazyModule("boto3")
+_botocore_exceptions = _LazyModule("botocore.exceptions")
+
+
+class _EnvJSON:
+    """
+    Config attribute parsed from a JSON env var on first read, then memoized by
+    replacing itself on the class. Assigning the attribute (AppConfig) simply
+    overrides it.
+    """
+
+    def __init__(self, env: str, default: str, transform: Optional[Callable[[Any], Any]] = None):
+        self.env = env
+        self.default = default
+        self.transform = transform
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner):
+        val = json.loads(os.environ.get(self.env, self.default))
+        if self.transform:
+            val = self.transform(val)
+        setattr(owner, self.name, val)
+        return val
 
 
 # =========================
@@ -30,15 +77,50 @@ class Config:
     POLLING_INTERVAL = int(os.environ.get('POLLING_INTERVAL', '6'))
     MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '40'))
 
+    # Duration-aware polling (per-job runtime history kept in DynamoDB)
+    POLL_ADAPTIVE = os.environ.get("POLL_ADAPTIVE", "true").lower() == "true"
+    POLL_MIN_INTERVAL = float(os.environ.get("POLL_MIN_INTERVAL", "2"))
+    POLL_MAX_INTERVAL = float(os.environ.get("POLL_MAX_INTERVAL", "30"))
+    POLL_BACKOFF_FACTOR = float(os.environ.get("POLL_BACKOFF_FACTOR", "1.5"))
+    POLL_JITTER = float(os.environ.get("POLL_JITTER", "0.2"))
+    POLL_FIRST_CHECK_FACTOR = float(os.environ.get("POLL_FIRST_CHECK_FACTOR", "0.9"))
+    JOB_STATS_ALPHA = float(os.environ.get("JOB_STATS_ALPHA", "0.3"))
+    JOB_STATS_WINDOW = int(os.environ.get("JOB_STATS_WINDOW", "50"))
+    JOB_STATS_TTL_DAYS = int(os.environ.get("JOB_STATS_TTL_DAYS", "30"))
+
+    # Validate options against the Rundeck job definition before starting it
+    JOB_PREFLIGHT = os.environ.get("JOB_PREFLIGHT", "true").lower() == "true"
+    JOB_SCHEMA_CACHE_SECONDS = int(os.environ.get("JOB_SCHEMA_CACHE_SECONDS", "300"))
+
+    # Incremental output tailing while polling (output endpoint offsets)
+    POLL_TAIL_OUTPUT = os.environ.get("POLL_TAIL_OUTPUT", "true").lower() == "true"
+    POLL_TAIL_MAXLINES = int(os.environ.get("POLL_TAIL_MAXLINES", "500"))
+    # Throttled progress snippets on the Rootly timeline for long jobs (0 = off)
+    POLL_PROGRESS_SECONDS = int(os.environ.get("POLL_PROGRESS_SECONDS", "0"))
+    POLL_PROGRESS_LINES = int(os.environ.get("POLL_PROGRESS_LINES", "10"))
+
     # ---------- DynamoDB ----------
     DDB_TABLE = os.environ.get('DYNAMODB_TABLE', 'ProcessedIncidentsTable')
     REM_GUARD_TTL = int(os.environ.get("GUARD_TTL_SECONDS", "5"))
     AUTO_DEDUPE_TTL = int(os.environ.get("AUTO_DEDUPE_TTL", "300"))
     MIRROR_DEDUPE_TTL = int(os.environ.get("MIRROR_DEDUPE_TTL", "300"))
+    GUARD_L1_MAX_ENTRIES = int(os.environ.get("GUARD_L1_MAX_ENTRIES", "2048"))
+
+    # ---------- AWS SDK clients (shared across warm invocations) ----------
+    AWS_CONNECT_TIMEOUT = float(os.environ.get("AWS_CONNECT_TIMEOUT", "2"))
+    AWS_READ_TIMEOUT = float(os.environ.get("AWS_READ_TIMEOUT", "5"))
+    AWS_MAX_POOL_CONNECTIONS = int(os.environ.get("AWS_MAX_POOL_CONNECTIONS", "10"))
+    AWS_RETRY_MODE = os.environ.get("AWS_RETRY_MODE", "standard")
+    AWS_MAX_ATTEMPTS = int(os.environ.get("AWS_MAX_ATTEMPTS", "3"))
 
     # Lambda self invoke (async poll)
     LAMBDA_FUNCTION_NAME = os.environ.get('ASYNC_POLL_LAMBDA_NAME', '')
 
+    # Batched polling: started executions are registered here and a scheduled
+    # poll.sweep event checks them all in one pass (replaces the async poll)
+    PENDING_EXECUTIONS_TABLE = os.environ.get("PENDING_EXECUTIONS_TABLE", "")
+    SWEEP_MAX_AGE_SECONDS = int(os.environ.get("SWEEP_MAX_AGE_SECONDS", str(MAX_RETRIES * POLLING_INTERVAL)))
+
     # ---------- In-code defaults (overridden by AppConfig) ----------
     REMEDIATION_JOB_ID_MAP: Dict[str, str] = {}
 
@@ -47,11 +129,10 @@ class Config:
 
     # Auto diagnosis routing is driven by watch_id
     DEFAULT_WATCH_TO_DIAG_MAP: Dict[str, str] = {}
-    WATCH_TO_DIAG_MAP = {
+    WATCH_TO_DIAG_MAP: Dict[str, str] = _EnvJSON("WATCH_TO_DIAG_MAP", "{}", lambda env: {
         re.sub(r'[^a-z0-9]+', '_', (k or '').strip().lower()).strip('_'): v
-        for k, v in {**DEFAULT_WATCH_TO_DIAG_MAP,
-                    **json.loads(os.environ.get("WATCH_TO_DIAG_MAP", "{}"))}.items()
-    }
+        for k, v in {**Config.DEFAULT_WATCH_TO_DIAG_MAP, **env}.items()
+    })
 
     REMEDIATION_DEFAULT_OPTION_MAP = {
         "data.custom_fields.environment_orn": "env_orn",
@@ -63,7 +144,7 @@ class Config:
         "data.custom_fields.environment_orn": "env_orn",
     }
 
-    RUNDECK_OPTION_MAP = json.loads(os.environ.get("RUNDECK_OPTION_MAP", "{}"))
+    RUNDECK_OPTION_MAP: Dict[str, str] = _EnvJSON("RUNDECK_OPTION_MAP", "{}")
 
     PASS_ALL_CUSTOM_FIELDS = os.environ.get("PASS_ALL_CUSTOM_FIELDS", "false").lower() == "true"
 
@@ -71,13 +152,61 @@ class Config:
     MIRROR_FIELD_ID = os.environ.get("MIRROR_FIELD_ID", "").strip()
     MIRROR_FIELD_SLUG = os.environ.get("MIRROR_FIELD_SLUG", "").strip()
     MIRROR_TOKEN_PREFIX = (os.environ.get("MIRROR_TOKEN_PREFIX", "mrr").strip() or "mrr")
+    MIRROR_FIELD_CACHE_SECONDS = int(os.environ.get("MIRROR_FIELD_CACHE_SECONDS", "3600"))
+    # (incident, field) -> selection id, so repeat mirror writes are a single PATCH
+    SELECTION_CACHE_SECONDS = int(os.environ.get("SELECTION_CACHE_SECONDS", str(7 * 24 * 3600)))
+    SELECTION_CACHE_MAX_ENTRIES = int(os.environ.get("SELECTION_CACHE_MAX_ENTRIES", "1024"))
+    SELECTION_LIST_MAX_PAGES = int(os.environ.get("SELECTION_LIST_MAX_PAGES", "20"))
 
     TIMEOUT = int(os.environ.get("HTTP_TIMEOUT_SECONDS", "30"))
 
+    # ---------- Rootly client-side rate limits (token bucket per endpoint class) ----------
+    # class -> requests/second, or {"rate": r, "burst": b}; classes: events, read, write
+    ROOTLY_RATE_LIMITS: Dict[str, Any] = _EnvJSON("ROOTLY_RATE_LIMITS", '{"events": 5, "read": 10, "write": 5}')
+    ROOTLY_RATE_MIN_FACTOR = float(os.environ.get("ROOTLY_RATE_MIN_FACTOR", "0.1"))  # floor after 429 backoff
+    ROOTLY_RATE_RECOVERY = float(os.environ.get("ROOTLY_RATE_RECOVERY", "0.05"))     # +fraction of base per success
+    ROOTLY_RATE_MAX_WAIT = float(os.environ.get("ROOTLY_RATE_MAX_WAIT", "30"))      # cap on a single queue wait
+
+    # ---------- Invocation deadline (context.get_remaining_time_in_millis) ----------
+    # Kept back from every HTTP / DynamoDB / sleep budget for posting the error or mirror note
+    DEADLINE_RESERVE_SECONDS = float(os.environ.get("DEADLINE_RESERVE_SECONDS", "3"))
+    # Inline / async polling hands the execution off once less than this would remain
+    DEADLINE_HANDOFF_SECONDS = float(os.environ.get("DEADLINE_HANDOFF_SECONDS", "5"))
+    # botocore read timeout (single attempt) once the deadline is closer than the normal retry budget
+    DEADLINE_AWS_READ_TIMEOUT = float(os.environ.get("DEADLINE_AWS_READ_TIMEOUT", "1"))
+
+    # ---------- Circuit breakers (per upstream: rundeck, rootly) ----------
+    CIRCUIT_BREAKER_ENABLED = os.environ.get("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "5"))  # consecutive failures
+    CIRCUIT_OPEN_SECONDS = float(os.environ.get("CIRCUIT_OPEN_SECONDS", "30"))
+    CIRCUIT_HALF_OPEN_PROBES = int(os.environ.get("CIRCUIT_HALF_OPEN_PROBES", "1"))
+    # Share open circuits across containers through the DynamoDB table
+    CIRCUIT_SHARED = os.environ.get("CIRCUIT_SHARED", "false").lower() == "true"
+    CIRCUIT_SHARED_REFRESH_SECONDS = float(os.environ.get("CIRCUIT_SHARED_REFRESH_SECONDS", "5"))
+
+    # ---------- HTTP connection pools (reused across warm invocations) ----------
+    HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "10"))
+    HTTP_POOL_RETRIES = int(os.environ.get("HTTP_POOL_RETRIES", "2"))
+    HTTP_POOL_BACKOFF = float(os.environ.get("HTTP_POOL_BACKOFF", "0.5"))
+    # Independent Rootly writes (results / ROUTING:: / mirror prep) run on this many threads; <= 1 = sequential
+    ROOTLY_FANOUT_WORKERS = int(os.environ.get("ROOTLY_FANOUT_WORKERS", "4"))
+    # SQS/Kinesis batch mode: records routed in parallel per invocation
+    BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", "4"))
+
     # Preflight for auto diagnosis
-    REQUIRED_AUTO_DIAGNOSIS_OPTIONS: List[str] = json.loads(
-        os.environ.get("REQUIRED_AUTO_DIAGNOSIS_OPTIONS", '["env_orn"]')
-    )
+    REQUIRED_AUTO_DIAGNOSIS_OPTIONS: List[str] = _EnvJSON("REQUIRED_AUTO_DIAGNOSIS_OPTIONS", '["env_orn"]')
+
+    # ---------- Logging ----------
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+    # message -> fraction of INFO/DEBUG lines kept, e.g. {"Rundeck poll tick": 0.1}
+    LOG_SAMPLE_RATES: Dict[str, float] = _EnvJSON("LOG_SAMPLE_RATES", "{}")
+    # Hold log lines and write them in one batch at the end of each invocation
+    LOG_BUFFERED = os.environ.get("LOG_BUFFERED", "false").lower() == "true"
+    LOG_BUFFER_MAX_LINES = int(os.environ.get("LOG_BUFFER_MAX_LINES", "500"))
+
+    # ---------- Metrics (CloudWatch Embedded Metric Format) ----------
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "RootlyRundeckO11")
 
     FAIL_OPEN_ON_DDB_ERROR = os.environ.get("FAIL_OPEN_ON_DDB_ERROR", "false").lower() == "true"
 
@@ -86,12 +215,26 @@ class Config:
     APPCONFIG_ENV_ID = os.environ.get("APPCONFIG_ENV_ID", "")
     APPCONFIG_PROFILE_ID = os.environ.get("APPCONFIG_PROFILE_ID", "")
     APPCONFIG_CACHE_SECONDS = int(os.environ.get("APPCONFIG_CACHE_SECONDS", "60"))
+    # "api": AppConfig Data API via boto3; "extension": the AppConfig Lambda extension's
+    # local HTTP endpoint (the extension polls and caches outside the request path)
+    APPCONFIG_SOURCE = os.environ.get("APPCONFIG_SOURCE", "api").strip().lower()
+    APPCONFIG_EXTENSION_URL = os.environ.get("APPCONFIG_EXTENSION_URL", "http://localhost:2772").rstrip("/")
+    APPCONFIG_EXTENSION_TIMEOUT = float(os.environ.get("APPCONFIG_EXTENSION_TIMEOUT", "1"))
+    # "sync": refresh inline once the cache expires; "background": serve the current
+    # snapshot and refresh on a worker thread (stale-while-revalidate)
+    APPCONFIG_REFRESH_MODE = os.environ.get("APPCONFIG_REFRESH_MODE", "sync").strip().lower()
+    # Past this age (since the last successful poll) the handler refreshes inline again
+    APPCONFIG_MAX_STALE_SECONDS = int(os.environ.get("APPCONFIG_MAX_STALE_SECONDS", "600"))
 
 
 # =========================
 # Structured Logging
 # =========================
 class Log:
+    LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+    # any kwarg whose name contains one of these is redacted
+    REDACT_RE = re.compile(r"token|secret|authorization|auth|password|apikey|api_key")
+
     _logger = logging.getLogger("rootly_rundeck_o11")
     _logger.setLevel(logging.INFO)
     if not _logger.handlers:
@@ -100,14 +243,96 @@ class Log:
         _handler.setFormatter(_formatter)
         _logger.addHandler(_handler)
 
+    _min_level = LEVELS.get(Config.LOG_LEVEL, 20)
+    _sample: Optional[Dict[str, float]] = None  # LOG_SAMPLE_RATES, parsed on first use
+    _buffered = Config.LOG_BUFFERED
+    _buffer_max = Config.LOG_BUFFER_MAX_LINES
+    _buffer: List[str] = []
+    _buffer_lock = threading.Lock()
+    _redact_memo: Dict[str, bool] = {}
+
+    @staticmethod
+    def enabled(level: str) -> bool:
+        """Guard for log arguments that are expensive to build."""
+        return Log.LEVELS[level] >= Log._min_level
+
+    @staticmethod
+    def configure(level: Any = None, sample: Any = None, buffered: Any = None):
+        """Apply logging settings (AppConfig); invalid values are logged and ignored, never raised."""
+        if level is not None:
+            name = str(level).strip().upper()
+            if name in Log.LEVELS:
+                Log._min_level = Log.LEVELS[name]
+            elif name.isdigit():
+                Log._min_level = int(name)
+            else:
+                Log.warn("Invalid log level; keeping current", value=str(level)[:40])
+        if sample is not None:
+            try:
+                Log._sample = {str(k): float(v) for k, v in sample.items()}
+            except (AttributeError, TypeError, ValueError) as e:
+                Log.warn("Invalid log sample rates; keeping current", err=str(e))
+        if buffered is not None:
+            if isinstance(buffered, str):
+                buffered = buffered.strip().lower() == "true"
+            if not buffered:
+                Log.flush()
+            Log._buffered = bool(buffered)
+
+    @staticmethod
+    def _sample_rates() -> Dict[str, float]:
+        rates = Log._sample
+        if rates is None:
+            try:
+                rates = {str(k): float(v) for k, v in Config.LOG_SAMPLE_RATES.items()}
+            except (AttributeError, TypeError, ValueError) as e:
+                rates = {}
+                Log._logger.warning(json.dumps({"level": "WARN", "ts": datetime.datetime.utcnow().isoformat(),
+                                                "msg": "Invalid LOG_SAMPLE_RATES; sampling disabled",
+                                                "err": str(e)}))
+            Log._sample = rates
+        return rates
+
+    @staticmethod
+    def _redact(key: str) -> bool:
+        hit = Log._redact_memo.get(key)
+        if hit is None:
+            hit = Log._redact_memo[key] = Log.REDACT_RE.search(key.lower()) is not None
+        return hit
+
     @staticmethod
     def _emit(level: str, message: str, **kw):
+        lvl = Log.LEVELS[level]
+        if lvl < Log._min_level:
+            return
+        if lvl < 30:
+            rate = Log._sample_rates().get(message)
+            if rate is not None and random.random() >= rate:
+                return
         entry = {"level": level, "ts": datetime.datetime.utcnow().isoformat(), "msg": message}
-        for k in list(kw.keys()):
-            if any(s in k.lower() for s in ["token", "secret", "authorization", "auth", "password", "apikey", "api_key"]):
+        for k in kw:
+            if Log._redact(k):
                 kw[k] = "***redacted***"
         entry.update(kw)
-        Log._logger.info(json.dumps(entry))
+        line = json.dumps(entry)
+        if not Log._buffered:
+            Log._logger.info(line)
+            return
+        with Log._buffer_lock:
+            Log._buffer.append(line)
+            full = len(Log._buffer) >= Log._buffer_max
+        # errors go out right away so they survive a crash or timeout
+        if full or lvl >= 40:
+            Log.flush()
+
+    @staticmethod
+    def flush():
+        """Write buffered lines as one batch (one JSON object per line)."""
+        with Log._buffer_lock:
+            if not Log._buffer:
+                return
+            lines, Log._buffer = Log._buffer, []
+        Log._logger.info("\n".join(lines))
 
     @staticmethod
     def info(msg: str, **kw): Log._emit("INFO", msg, **kw)
@@ -119,11 +344,245 @@ class Log:
     def debug(msg: str, **kw): Log._emit("DEBUG", msg, **kw)
 
 
+# =========================
+# Metrics (CloudWatch EMF)
+# =========================
+class Metrics:
+    """
+    Per-invocation timings (ms) and counters, written by flush() as one EMF
+    document on stdout; CloudWatch turns it into metrics, no agent needed.
+    Safe to record from worker threads. Inside batch_record() a thread's
+    dimension/prop calls are dropped: concurrent records would overwrite
+    each other's Mode/Selector/status, so a batch reports one document with
+    EventType=batch and record-level timings/counters rolled up.
+    """
+    # rollups emitted for each metric; a set is used only when all its dimensions are known
+    DIMENSION_SETS = (("EventType",), ("EventType", "Mode"), ("EventType", "Mode", "Selector"))
+    MAX_VALUES = 100  # EMF limit per metric per document
+
+    _lock = threading.Lock()
+    _timings: Dict[str, List[float]] = {}
+    _counts: Dict[str, float] = {}
+    _dims: Dict[str, str] = {}
+    _props: Dict[str, Any] = {}
+    _scope = threading.local()
+
+    @staticmethod
+    @contextmanager
+    def batch_record():
+        Metrics._scope.in_batch = True
+        try:
+            yield
+        finally:
+            Metrics._scope.in_batch = False
+
+    @staticmethod
+    def _per_record() -> bool:
+        return getattr(Metrics._scope, "in_batch", False)
+
+    @staticmethod
+    def record(name: str, ms: float):
+        with Metrics._lock:
+            Metrics._timings.setdefault(name, []).append(round(ms, 3))
+
+    @staticmethod
+    def count(name: str, n: float = 1):
+        with Metrics._lock:
+            Metrics._counts[name] = Metrics._counts.get(name, 0) + n
+
+    @staticmethod
+    def dimension(**kw):
+        if Metrics._per_record():
+            return
+        with Metrics._lock:
+            Metrics._dims.update({k: str(v) for k, v in kw.items() if v})
+
+    @staticmethod
+    def set_dimensions(**kw):
+        """Replace all dimensions (e.g. a batch rolls up records with different modes)."""
+        with Metrics._lock:
+            Metrics._dims = {k: str(v) for k, v in kw.items() if v}
+
+    @staticmethod
+    def prop(**kw):
+        """Non-metric fields on the document (searchable in Logs Insights)."""
+        if Metrics._per_record():
+            return
+        with Metrics._lock:
+            Metrics._props.update(kw)
+
+    @staticmethod
+    @contextmanager
+    def span(name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            Metrics.record(name, (time.perf_counter() - t0) * 1000)
+
+    @staticmethod
+    def timed(name: str):
+        """Decorator: one span per call."""
+        def wrap(fn):
+            def inner(*a, **kw):
+                with Metrics.span(name):
+                    return fn(*a, **kw)
+            inner.__name__, inner.__doc__, inner.__wrapped__ = fn.__name__, fn.__doc__, fn
+            return inner
+        return wrap
+
+    @staticmethod
+    def flush():
+        with Metrics._lock:
+            timings, counts, dims, props = Metrics._timings, Metrics._counts, Metrics._dims, Metrics._props
+            Metrics._timings, Metrics._counts, Metrics._dims, Metrics._props = {}, {}, {}, {}
+        if not Config.METRICS_ENABLED or not (timings or counts):
+            return
+        doc: Dict[str, Any] = {**props, **dims}
+        defs = []
+        for name, vals in timings.items():
+            doc[name] = vals[:Metrics.MAX_VALUES]
+            defs.append({"Name": name, "Unit": "Milliseconds"})
+        for name, n in counts.items():
+            doc[name] = n
+            defs.append({"Name": name, "Unit": "Count"})
+        doc["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": Config.METRICS_NAMESPACE,
+                "Dimensions": [list(ds) for ds in Metrics.DIMENSION_SETS if all(d in dims for d in ds)] or [[]],
+                "Metrics": defs,
+            }],
+        }
+        sys.stdout.write(json.dumps(doc) + "\n")
+        sys.stdout.flush()
+
+
+class _TimedClient:
+    """Proxy recording a `<prefix>.<method>` span for every method call on the wrapped client."""
+
+    def __init__(self, target: Any, prefix: str):
+        self._target = target
+        self._prefix = prefix
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        metric = f"{self._prefix}.{name}"
+
+        def call(*a, **kw):
+            with Metrics.span(metric):
+                return attr(*a, **kw)
+        return call
+
+
+# =========================
+# Invocation deadline
+# =========================
+class DeadlineExceeded(TimeoutError):
+    """Raised by polling loops when continuing would eat into the reserved tail."""
+
+    def __init__(self, message: str, started: Optional[float] = None):
+        self.started = started
+        super().__init__(f"deadline exceeded: {message}")
+
+
+class Deadline:
+    """
+    Per-invocation deadline taken from the Lambda context. remaining() is the
+    time left before the reserved tail (DEADLINE_RESERVE_SECONDS); without a
+    context (tests, local runs) there is no deadline and it is infinite.
+    Batch workers share it, since one container runs one invocation at a time.
+    """
+    MIN_TIMEOUT = 0.5
+
+    _at: Optional[float] = None  # time.monotonic() at which Lambda stops the invocation
+    function_name = ""
+
+    @staticmethod
+    def start(context: Any):
+        Deadline._at = None
+        Deadline.function_name = str(getattr(context, "function_name", "") or "")
+        getter = getattr(context, "get_remaining_time_in_millis", None)
+        if callable(getter):
+            try:
+                Deadline._at = time.monotonic() + float(getter()) / 1000.0
+            except (TypeError, ValueError):
+                pass
+
+    @staticmethod
+    def remaining(reserve: bool = True) -> float:
+        if Deadline._at is None:
+            return math.inf
+        left = Deadline._at - time.monotonic()
+        return left - Config.DEADLINE_RESERVE_SECONDS if reserve else left
+
+    @staticmethod
+    def timeout(default: float) -> float:
+        """HTTP timeout capped by the deadline; inside the tail, by what is really left."""
+        left = Deadline.remaining()
+        if left < Deadline.MIN_TIMEOUT:
+            left = Deadline.remaining(reserve=False) - Deadline.MIN_TIMEOUT
+        return max(Deadline.MIN_TIMEOUT, min(float(default), left))
+
+    @staticmethod
+    def allows(seconds: float) -> bool:
+        """Whether sleeping `seconds` (e.g. a retry backoff) still leaves time for the next call."""
+        return Deadline.remaining() - seconds > Deadline.MIN_TIMEOUT
+
+
+# =========================
+# AWS client registry
+# =========================
+_AWS_CLIENTS: Dict[str, Any] = {}
+_AWS_CLIENTS_LOCK = threading.Lock()
+
+def _aws_client(service: str):
+    """
+    Lazily build one boto3 client per service for the whole process. Client
+    construction loads botocore models and costs tens of ms, so warm
+    invocations must reuse them. Once the invocation deadline is closer than
+    the normal retry budget, a second single-attempt client with a short
+    read timeout is used instead, so a slow call cannot outlive the function.
+    """
+    tight = Deadline.remaining() < Config.AWS_CONNECT_TIMEOUT + Config.AWS_READ_TIMEOUT * Config.AWS_MAX_ATTEMPTS
+    key = f"{service}#tight" if tight else service
+    c = _AWS_CLIENTS.get(key)
+    if c is not None:
+        return _TimedClient(c, service)
+    with _AWS_CLIENTS_LOCK:
+        c = _AWS_CLIENTS.get(key)
+        if c is None:
+            from botocore.config import Config as BotoConfig
+            if tight:
+                cfg = BotoConfig(
+                    connect_timeout=min(Config.AWS_CONNECT_TIMEOUT, Config.DEADLINE_AWS_READ_TIMEOUT),
+                    read_timeout=Config.DEADLINE_AWS_READ_TIMEOUT,
+                    max_pool_connections=Config.AWS_MAX_POOL_CONNECTIONS,
+                    retries={"mode": Config.AWS_RETRY_MODE, "total_max_attempts": 1},
+                )
+            else:
+                cfg = BotoConfig(
+                    connect_timeout=Config.AWS_CONNECT_TIMEOUT,
+                    read_timeout=Config.AWS_READ_TIMEOUT,
+                    max_pool_connections=Config.AWS_MAX_POOL_CONNECTIONS,
+                    retries={"mode": Config.AWS_RETRY_MODE, "total_max_attempts": Config.AWS_MAX_ATTEMPTS},
+                )
+            c = boto3.client(service, config=cfg)
+            _AWS_CLIENTS[key] = c
+            Log.info("AWS client created", service=service, retry_mode=Config.AWS_RETRY_MODE, tight=tight)
+    return _TimedClient(c, service)
+
+
 # =========================
 # Optional AppConfig
 # =========================
-_APPCONFIG_CACHE: Dict[str, Any] = {"exp": 0, "payload": None}
+_APPCONFIG_CACHE: Dict[str, Any] = {"exp": 0, "payload": None, "version": 0, "fetched": 0, "raw": b""}
 _APPCONFIG_SESSION_TOKEN: Optional[str] = None
+# Serializes polls: the session token must not be used by two refreshes at once
+_APPCONFIG_LOCK = threading.Lock()
+_APPCONFIG_REFRESH_THREAD: Optional[threading.Thread] = None
 
 def _bytes_from_configuration(cfg) -> bytes:
     if cfg is None:
@@ -137,7 +596,7 @@ def _bytes_from_configuration(cfg) -> bytes:
     return bytes(cfg)
 
 def _appconfig_start_session() -> str:
-    c = boto3.client("appconfigdata")
+    c = _aws_client("appconfigdata")
     resp = c.start_configuration_session(
         ApplicationIdentifier=Config.APPCONFIG_APP_ID,
         EnvironmentIdentifier=Config.APPCONFIG_ENV_ID,
@@ -146,12 +605,33 @@ def _appconfig_start_session() -> str:
     return resp["InitialConfigurationToken"]
 
 def _appconfig_get_latest(token: str) -> tuple[str, bytes]:
-    c = boto3.client("appconfigdata")
+    c = _aws_client("appconfigdata")
     resp = c.get_latest_configuration(ConfigurationToken=token)
     nxt = resp.get("NextPollConfigurationToken") or token
     blob = _bytes_from_configuration(resp.get("Configuration"))
     return nxt, blob
 
+def _appconfig_extension_get() -> bytes:
+    """
+    Read the configuration from the AppConfig Lambda extension. The extension
+    always returns the full document; HTTP errors (e.g. 404 for an unknown
+    profile) are raised as RuntimeError.
+    """
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+    q = urllib.parse.quote
+    url = (f"{Config.APPCONFIG_EXTENSION_URL}/applications/{q(Config.APPCONFIG_APP_ID, safe='')}"
+           f"/environments/{q(Config.APPCONFIG_ENV_ID, safe='')}"
+           f"/configurations/{q(Config.APPCONFIG_PROFILE_ID, safe='')}")
+    try:
+        with urllib.request.urlopen(url, timeout=Config.APPCONFIG_EXTENSION_TIMEOUT) as r:
+            return r.read()
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(f"AppConfig extension returned HTTP {e.code}: {e.read()[:200]!r}")
+    except (urllib.error.URLError, OSError) as e:
+        raise RuntimeError(f"AppConfig extension unreachable at {Config.APPCONFIG_EXTENSION_URL}: {e}")
+
 def _normalize_keys(d: Dict[str, str]) -> Dict[str, str]:
     out = {}
     for k, v in (d or {}).items():
@@ -159,29 +639,119 @@ def _normalize_keys(d: Dict[str, str]) -> Dict[str, str]:
         out[nk] = str(v)
     return out
 
-def apply_appconfig_overrides(force: bool = False):
-    if not (Config.APPCONFIG_APP_ID and Config.APPCONFIG_ENV_ID and Config.APPCONFIG_PROFILE_ID):
-        Log.info("AppConfig not configured; using in-code defaults")
-        return
+def _appconfig_configured() -> bool:
+    return bool(Config.APPCONFIG_APP_ID and Config.APPCONFIG_ENV_ID and Config.APPCONFIG_PROFILE_ID)
 
-    now = time.time()
-    if not force and _APPCONFIG_CACHE["payload"] and _APPCONFIG_CACHE["exp"] > now:
-        return
 
+def refresh_appconfig(apply: bool = True) -> bool:
+    """
+    Poll AppConfig once and apply the payload if it changed. Returns True when
+    the cached snapshot is current afterwards (new payload or unchanged).
+    With apply=False (background worker) a new payload is only parked in
+    _APPCONFIG_CACHE["pending"]; the handler applies it between events, so
+    Config never changes under an event being routed.
+    Callers hold _APPCONFIG_LOCK.
+    """
     global _APPCONFIG_SESSION_TOKEN
-    if not _APPCONFIG_SESSION_TOKEN:
-        _APPCONFIG_SESSION_TOKEN = _appconfig_start_session()
+    if Config.APPCONFIG_SOURCE == "extension":
+        blob = _appconfig_extension_get()
+    else:
+        if not _APPCONFIG_SESSION_TOKEN:
+            _APPCONFIG_SESSION_TOKEN = _appconfig_start_session()
+        _APPCONFIG_SESSION_TOKEN, blob = _appconfig_get_latest(_APPCONFIG_SESSION_TOKEN)
 
-    _APPCONFIG_SESSION_TOKEN, blob = _appconfig_get_latest(_APPCONFIG_SESSION_TOKEN)
+    now = time.time()
+    if blob and blob == _APPCONFIG_CACHE["raw"] and _APPCONFIG_CACHE["payload"]:
+        blob = b""  # same document as last time (the extension always returns it in full)
     if not blob:
-        Log.warn("AppConfig returned empty configuration; keeping existing config")
-        return
+        if not _APPCONFIG_CACHE["payload"]:
+            Log.warn("AppConfig returned empty configuration; keeping existing config")
+            return False
+        # Nothing changed since the last poll (the data API returns an empty body)
+        _APPCONFIG_CACHE["fetched"] = now
+        _APPCONFIG_CACHE["exp"] = now + max(10, Config.APPCONFIG_CACHE_SECONDS)
+        return True
 
     try:
         payload = json.loads(blob.decode("utf-8"))
     except Exception as e:
         raise RuntimeError(f"AppConfig JSON parse error: {e}")
 
+    if apply:
+        _APPCONFIG_CACHE.pop("pending", None)
+        _apply_appconfig_payload(payload)
+    else:
+        _APPCONFIG_CACHE["pending"] = payload
+    _APPCONFIG_CACHE["raw"] = blob
+    _APPCONFIG_CACHE["fetched"] = now
+    _APPCONFIG_CACHE["exp"] = now + max(10, Config.APPCONFIG_CACHE_SECONDS)
+    return True
+
+
+def _appconfig_refresh_worker():
+    try:
+        with _APPCONFIG_LOCK:
+            refresh_appconfig(apply=False)
+    except Exception as e:
+        Log.warn("Background AppConfig refresh failed; serving cached config", err=str(e),
+                age_s=int(time.time() - _APPCONFIG_CACHE["fetched"]))
+
+
+def _start_appconfig_refresh() -> bool:
+    global _APPCONFIG_REFRESH_THREAD
+    t = _APPCONFIG_REFRESH_THREAD
+    if t is not None and t.is_alive():
+        return False
+    t = threading.Thread(target=_appconfig_refresh_worker, name="appconfig-refresh", daemon=True)
+    _APPCONFIG_REFRESH_THREAD = t
+    t.start()
+    return True
+
+
+@Metrics.timed("appconfig")
+def apply_appconfig_overrides(force: bool = False):
+    """
+    Make sure Config reflects AppConfig before routing.
+
+    In "background" mode an expired snapshot is served as is while a worker
+    thread fetches a new one (Lambda may freeze that thread after the
+    response; it resumes on the next invocation). What the worker fetched
+    is applied here, at the start of the next event. The first load,
+    force=True, and a snapshot older than APPCONFIG_MAX_STALE_SECONDS still
+    refresh inline.
+    """
+    if not _appconfig_configured():
+        Log.info("AppConfig not configured; using in-code defaults")
+        return
+
+    pending = _APPCONFIG_CACHE.pop("pending", None)
+    if pending is not None:
+        _apply_appconfig_payload(pending)
+
+    now = time.time()
+    have = bool(_APPCONFIG_CACHE["payload"])
+    if not force and have and _APPCONFIG_CACHE["exp"] > now:
+        return
+
+    age = now - _APPCONFIG_CACHE["fetched"]
+    if (not force and have and Config.APPCONFIG_REFRESH_MODE == "background"
+            and age < Config.APPCONFIG_MAX_STALE_SECONDS):
+        if _start_appconfig_refresh():
+            Log.info("AppConfig refresh started in background", age_s=int(age))
+        return
+
+    # Inline refresh; don't queue forever behind a wedged background poll
+    if not _APPCONFIG_LOCK.acquire(timeout=Config.AWS_CONNECT_TIMEOUT + Config.AWS_READ_TIMEOUT):
+        raise RuntimeError(f"AppConfig refresh still in progress; config is {int(age)}s old")
+    try:
+        if not force and _APPCONFIG_CACHE["payload"] and _APPCONFIG_CACHE["exp"] > time.time():
+            return  # a background refresh finished while we waited
+        refresh_appconfig()
+    finally:
+        _APPCONFIG_LOCK.release()
+
+
+def _apply_appconfig_payload(payload: Dict[str, Any]):
     rd = payload.get("rundeck") or {}
     if rd.get("url"):     Config.RUNDECK_URL = str(rd["url"])
     if rd.get("project"): Config.RUNDECK_PROJECT = str(rd["project"])
@@ -202,8 +772,20 @@ def apply_appconfig_overrides(force: bool = False):
     Config.REQUIRED_AUTO_DIAGNOSIS_OPTIONS = list(required) or Config.REQUIRED_AUTO_DIAGNOSIS_OPTIONS
     Config.PASS_ALL_CUSTOM_FIELDS = pass_all
 
+    logging_cfg = payload.get("logging") or {}
+    if logging_cfg:
+        Log.configure(level=logging_cfg.get("level"), sample=logging_cfg.get("sampleRates"),
+                      buffered=logging_cfg.get("buffered"))
+
+    sections = payload.get("outputSections")
+    if sections:
+        try:
+            OUTPUT_PARSER.configure_sections(sections)
+        except (ValueError, TypeError, AttributeError, re.error) as e:
+            Log.warn("Invalid outputSections in AppConfig; keeping current section rules", err=str(e))
+
     _APPCONFIG_CACHE["payload"] = payload
-    _APPCONFIG_CACHE["exp"] = now + max(10, Config.APPCONFIG_CACHE_SECONDS)
+    _APPCONFIG_CACHE["version"] += 1
 
     Log.info("AppConfig applied (O11)",
             remediation=len(Config.REMEDIATION_JOB_ID_MAP),
@@ -212,7 +794,383 @@ def apply_appconfig_overrides(force: bool = False):
             options_diag=len({**Config.DIAGNOSIS_DEFAULT_OPTION_MAP, **Config.RUNDECK_OPTION_MAP}),
             options_rem=len({**Config.REMEDIATION_DEFAULT_OPTION_MAP, **Config.RUNDECK_OPTION_MAP}),
             auto_required=len(Config.REQUIRED_AUTO_DIAGNOSIS_OPTIONS),
-            pass_all=Config.PASS_ALL_CUSTOM_FIELDS)
+            pass_all=Config.PASS_ALL_CUSTOM_FIELDS,
+            section_rules=len(OUTPUT_PARSER.sections.groups))
+
+
+# =========================
+# Pooled HTTP sessions (one per upstream)
+# =========================
+_HTTP_SESSIONS: Dict[str, "requests.Session"] = {}
+
+def _http_retry_budget() -> float:
+    """Worst case for one call through the adapter: every attempt times out, plus urllib3's backoff sleeps."""
+    retries = Config.HTTP_POOL_RETRIES
+    return (retries + 1) * Config.TIMEOUT + Config.HTTP_POOL_BACKOFF * (2 ** retries - 1)
+
+
+def _http_session(upstream: str, status_forcelist: tuple = (), tight: bool = False) -> "requests.Session":
+    """
+    Module-scoped keep-alive session per upstream so warm invocations reuse
+    TCP/TLS connections. The adapter retries connection setup failures (and,
+    for idempotent methods, any status in status_forcelist) with backoff.
+    `tight` returns a second pool without adapter retries, used once the
+    invocation deadline is closer than the retry budget (see _DeadlineSession).
+    """
+    key = f"{upstream}#tight" if tight else upstream
+    s = _HTTP_SESSIONS.get(key)
+    if s is not None:
+        return s
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    if tight:
+        retry = Retry(total=0, raise_on_status=False)
+    else:
+        retry = Retry(
+            total=Config.HTTP_POOL_RETRIES,
+            connect=Config.HTTP_POOL_RETRIES,
+            read=0,
+            status=Config.HTTP_POOL_RETRIES if status_forcelist else 0,
+            status_forcelist=status_forcelist,
+            allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+            backoff_factor=Config.HTTP_POOL_BACKOFF,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(pool_connections=Config.HTTP_POOL_SIZE,
+                        pool_maxsize=Config.HTTP_POOL_SIZE,
+                        max_retries=retry)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    _HTTP_SESSIONS[key] = s
+    Log.info("HTTP session pool created", upstream=key, pool_size=Config.HTTP_POOL_SIZE,
+            retries=0 if tight else Config.HTTP_POOL_RETRIES)
+    return s
+
+
+class _DeadlineSession:
+    """
+    Proxy picking the upstream's session per call: the retrying pool normally,
+    the single-attempt pool once Deadline.remaining() is below the adapter's
+    retry budget, so retries and backoff cannot carry a call past the deadline.
+    """
+
+    def __init__(self, upstream: str, status_forcelist: tuple = ()):
+        self._upstream = upstream
+        self._status_forcelist = status_forcelist
+
+    def __getattr__(self, name: str):
+        tight = Deadline.remaining() < _http_retry_budget()
+        return getattr(_http_session(self._upstream, self._status_forcelist, tight=tight), name)
+
+
+# =========================
+# Rootly write fan-out
+# =========================
+_FANOUT_POOL = None
+_FANOUT_LOCK = threading.Lock()
+
+def _fanout(fn: Callable, *a, **kw):
+    """
+    Run fn on the shared bounded pool and return its Future. With
+    ROOTLY_FANOUT_WORKERS <= 1 it runs inline and returns a finished Future.
+    Callers must wait on every Future before the invocation returns
+    (Lambda freezes the process afterwards).
+    """
+    global _FANOUT_POOL
+    from concurrent.futures import Future, ThreadPoolExecutor
+    if Config.ROOTLY_FANOUT_WORKERS <= 1:
+        f = Future()
+        try:
+            f.set_result(fn(*a, **kw))
+        except Exception as e:
+            f.set_exception(e)
+        return f
+    if _FANOUT_POOL is None:
+        with _FANOUT_LOCK:
+            if _FANOUT_POOL is None:
+                _FANOUT_POOL = ThreadPoolExecutor(max_workers=Config.ROOTLY_FANOUT_WORKERS,
+                                                  thread_name_prefix="rootly-fanout")
+    return _FANOUT_POOL.submit(fn, *a, **kw)
+
+
+def _wait(futures) -> None:
+    """Ordering barrier: block until the futures are done, ignoring their outcome."""
+    from concurrent.futures import wait
+    pending = [f for f in futures if f is not None]
+    if pending:
+        wait(pending)
+
+
+def _join(futures) -> None:
+    """Wait for every future, then re-raise the first failure (if any)."""
+    _wait(futures)
+    for f in futures:
+        if f is not None:
+            f.result()
+
+
+# =========================
+# Rootly rate limiting
+# =========================
+def _header(headers: Any, name: str) -> Optional[str]:
+    if not headers:
+        return None
+    v = headers.get(name)
+    if v is None:
+        lname = name.lower()
+        v = next((hv for hk, hv in headers.items() if str(hk).lower() == lname), None)
+    return v
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """Retry-After (seconds or HTTP date), else X-RateLimit-Reset (epoch or delta seconds)."""
+    ra = _header(headers, "Retry-After")
+    if ra:
+        try:
+            return max(0.0, float(ra))
+        except ValueError:
+            from email.utils import parsedate_to_datetime
+            try:
+                return max(0.0, parsedate_to_datetime(ra).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    reset = _header(headers, "X-RateLimit-Reset")
+    if reset:
+        try:
+            r = float(reset)
+            return max(0.0, r - time.time()) if r > 1e9 else max(0.0, r)
+        except ValueError:
+            pass
+    return None
+
+
+class TokenBucket:
+    """
+    Token bucket with AIMD rate control: a 429 halves the rate (down to
+    min_factor x base) and blocks the bucket until the server's retry time;
+    each success recovers `recovery` x base. Tokens may go negative, which
+    reserves a slot for a caller that is already waiting.
+    """
+
+    def __init__(self, rate: float, burst: float, min_factor: float, recovery: float):
+        self.base_rate = max(0.01, rate)
+        self.rate = self.base_rate
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.min_rate = self.base_rate * max(0.01, min(1.0, min_factor))
+        self.recovery = recovery
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take a token; returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def throttled(self, retry_after: Optional[float]):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def observe(self, headers: Any):
+        """Successful response: recover rate; an exhausted X-RateLimit-Remaining blocks until reset."""
+        remaining = _header(headers, "X-RateLimit-Remaining")
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.recovery)
+            if remaining is not None and str(remaining).strip() in ("0", "0.0"):
+                reset = _retry_after_seconds({"X-RateLimit-Reset": _header(headers, "X-RateLimit-Reset")})
+                if reset:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + reset)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {"rate": round(self.rate, 3), "base_rate": self.base_rate, "tokens": round(self.tokens, 2)}
+
+
+_ROOTLY_BUCKETS: Dict[str, TokenBucket] = {}
+_ROOTLY_BUCKETS_LOCK = threading.Lock()
+
+
+def _rootly_endpoint_class(method: str, path: str) -> str:
+    if method.upper() == "POST" and path.split("?", 1)[0].endswith("/events"):
+        return "events"
+    return "read" if method.upper() in ("GET", "HEAD") else "write"
+
+
+def rootly_bucket(endpoint_class: str) -> TokenBucket:
+    """Process-wide bucket per endpoint class, shared by every RootlyClient and thread."""
+    b = _ROOTLY_BUCKETS.get(endpoint_class)
+    if b is not None:
+        return b
+    with _ROOTLY_BUCKETS_LOCK:
+        b = _ROOTLY_BUCKETS.get(endpoint_class)
+        if b is None:
+            spec = (Config.ROOTLY_RATE_LIMITS or {}).get(endpoint_class, 5)
+            rate = float(spec.get("rate", 5) if isinstance(spec, dict) else spec)
+            burst = float(spec.get("burst", rate) if isinstance(spec, dict) else rate)
+            b = TokenBucket(rate, burst, Config.ROOTLY_RATE_MIN_FACTOR, Config.ROOTLY_RATE_RECOVERY)
+            _ROOTLY_BUCKETS[endpoint_class] = b
+    return b
+
+
+# =========================
+# Circuit breakers
+# =========================
+class CircuitOpenError(Exception):
+    def __init__(self, upstream: str, retry_in: float):
+        self.upstream = upstream
+        self.retry_in = retry_in
+        super().__init__(f"{upstream} circuit open: failing fast for {retry_in:.0f}s after repeated failures")
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after CIRCUIT_FAILURE_THRESHOLD consecutive failures
+    (connection errors, timeouts, 5xx); open calls raise CircuitOpenError
+    without touching the network. After CIRCUIT_OPEN_SECONDS up to
+    CIRCUIT_HALF_OPEN_PROBES calls go through: a success closes the
+    circuit, a failure re-opens it. With CIRCUIT_SHARED the open window is
+    published to DynamoDB so other containers stop calling too.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = "closed"
+        self.failures = 0
+        self.open_until = 0.0
+        self.probes = 0
+        self._synced = 0.0
+        self._lock = threading.Lock()
+
+    def _sync_shared(self, now: float):
+        if not Config.CIRCUIT_SHARED or self.state != "closed" \
+                or now - self._synced < Config.CIRCUIT_SHARED_REFRESH_SECONDS:
+            return
+        self._synced = now
+        try:
+            until = float(DDB().get_cache_entry(f"circuit#{self.name}").get("until") or 0)
+        except Exception as e:
+            Log.warn("Shared circuit read failed", upstream=self.name, err=str(e))
+            return
+        if until > now:
+            with self._lock:
+                if self.state == "closed":
+                    self.state, self.open_until = "open", until
+                    Log.warn("Circuit opened by another instance", upstream=self.name,
+                            open_for=round(until - now, 1))
+
+    def _publish(self, until: Optional[float]):
+        if not Config.CIRCUIT_SHARED:
+            return
+        try:
+            if until:
+                DDB().put_cache_entry(f"circuit#{self.name}", {"state": "open", "until": str(until)},
+                                      ttl_seconds=max(1, math.ceil(until - time.time())))
+            else:
+                DDB().delete_cache_entry(f"circuit#{self.name}")
+        except Exception as e:
+            Log.warn("Shared circuit write failed", upstream=self.name, err=str(e))
+
+    def allow(self):
+        """Raise CircuitOpenError unless a call may go out now."""
+        now = time.time()
+        self._sync_shared(now)
+        with self._lock:
+            if self.state == "open":
+                if now < self.open_until:
+                    Metrics.count(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(self.name, self.open_until - now)
+                self.state, self.probes = "half_open", 0
+                Log.info("Circuit half-open", upstream=self.name)
+            if self.state == "half_open":
+                if self.probes >= max(1, Config.CIRCUIT_HALF_OPEN_PROBES):
+                    Metrics.count(f"circuit.{self.name}.rejected")
+                    raise CircuitOpenError(self.name, 0)
+                self.probes += 1
+
+    def success(self):
+        with self._lock:
+            recovered = self.state != "closed"
+            self.state, self.failures, self.probes = "closed", 0, 0
+        if recovered:
+            Log.info("Circuit closed", upstream=self.name)
+            self._publish(None)
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state != "half_open" and self.failures < Config.CIRCUIT_FAILURE_THRESHOLD:
+                return
+            self.state, self.probes = "open", 0
+            self.open_until = time.time() + Config.CIRCUIT_OPEN_SECONDS
+            until = self.open_until
+        Log.error("Circuit opened", upstream=self.name, failures=self.failures,
+                 open_seconds=Config.CIRCUIT_OPEN_SECONDS)
+        Metrics.count(f"circuit.{self.name}.opened")
+        self._publish(until)
+
+    def release(self):
+        """Call ended without telling us anything about upstream health."""
+        with self._lock:
+            if self.state == "half_open" and self.probes:
+                self.probes -= 1
+
+
+_CIRCUITS: Dict[str, CircuitBreaker] = {}
+_CIRCUITS_LOCK = threading.Lock()
+
+
+def circuit_breaker(upstream: str) -> CircuitBreaker:
+    b = _CIRCUITS.get(upstream)
+    if b is not None:
+        return b
+    with _CIRCUITS_LOCK:
+        return _CIRCUITS.setdefault(upstream, CircuitBreaker(upstream))
+
+
+class _BreakerClient:
+    """Proxy routing a session's HTTP verbs through the upstream's circuit breaker."""
+    VERBS = ("request", "get", "post", "put", "patch", "delete", "head")
+
+    def __init__(self, target: Any, breaker: CircuitBreaker):
+        self._target = target
+        self._breaker = breaker
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name not in self.VERBS or not Config.CIRCUIT_BREAKER_ENABLED:
+            return attr
+        breaker = self._breaker
+
+        def call(*a, **kw):
+            breaker.allow()
+            try:
+                r = attr(*a, **kw)
+            except requests.RequestException:
+                breaker.failure()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            if r.status_code >= 500:
+                breaker.failure()
+            else:
+                breaker.success()
+            return r
+        return call
 
 
 # =========================
@@ -223,33 +1181,75 @@ class RootlyClient:
         if not Config.ROOTLY_API_TOKEN:
             Log.warn("ROOTLY_API_TOKEN missing (requests may fail)")
         self.base = Config.ROOTLY_BASE_URL
+        # 5xx retries are handled (and logged) by request(); the pool only retries connect errors
+        self._session = None
         self.headers = {
             "Authorization": f"Bearer {Config.ROOTLY_API_TOKEN}",
             "Content-Type": "application/vnd.api+json",
             "Accept": "application/vnd.api+json",
         }
 
-    def request(self, method: str, path: str, max_retries: int = 3, **k) -> requests.Response:
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            self._session = _BreakerClient(_TimedClient(_DeadlineSession("rootly"), "rootly"),
+                                           circuit_breaker("rootly"))
+        return self._session
+
+    @session.setter
+    def session(self, s):
+        self._session = s
+
+    def _throttle(self, bucket: TokenBucket, endpoint_class: str) -> float:
+        wait = min(bucket.reserve(), Config.ROOTLY_RATE_MAX_WAIT, max(0.0, Deadline.remaining()))
+        if wait > 0:
+            Metrics.count("rootly.queued_requests")
+            time.sleep(wait)
+        Metrics.record(f"rootly.queued.{endpoint_class}", wait * 1000)
+        return wait
+
+    def request(self, method: str, path: str, max_retries: int = 3, **k) -> "requests.Response":
         url = f"{self.base}{path}"
-        k.setdefault("timeout", Config.TIMEOUT)
+        timeout = k.pop("timeout", None)
+        endpoint_class = _rootly_endpoint_class(method, path)
+        bucket = rootly_bucket(endpoint_class)
         Log.info("Rootly request begin", method=method, path=path)
         for attempt in range(max_retries):
             try:
-                r = requests.request(method, url, headers=self.headers, **k)
-                Log.info("Rootly response", path=path, status=r.status_code, attempt=attempt+1)
-                if r.status_code >= 500 and attempt < (max_retries - 1):
+                queued = self._throttle(bucket, endpoint_class)
+                r = self.session.request(method, url, headers=self.headers,
+                                         timeout=timeout or Deadline.timeout(Config.TIMEOUT), **k)
+                Log.info("Rootly response", path=path, status=r.status_code, attempt=attempt+1,
+                        queued_ms=int(queued * 1000))
+                if r.status_code == 429:
+                    retry_after = _retry_after_seconds(getattr(r, "headers", None))
+                    bucket.throttled(retry_after)
+                    Metrics.count("rootly.throttled")
+                    if attempt < (max_retries - 1) and Deadline.allows(retry_after or 0):
+                        # the next _throttle() waits out Retry-After at the reduced rate
+                        Log.warn("Rootly 429, retrying", path=path, retry_after=retry_after,
+                                attempt=attempt+1, **bucket.stats())
+                        Metrics.count("rootly.retries")
+                        continue
+                    return r
+                if r.status_code < 500:
+                    bucket.observe(getattr(r, "headers", None))
+                if r.status_code >= 500 and attempt < (max_retries - 1) and Deadline.allows(2 ** attempt):
                     Log.warn("Rootly 5xx, retrying", path=path, code=r.status_code, attempt=attempt+1)
+                    Metrics.count("rootly.retries")
                     time.sleep(2 ** attempt)
                     continue
                 return r
             except requests.RequestException as e:
                 Log.warn("Rootly request exception, retrying", path=path, err=str(e), attempt=attempt+1)
-                if attempt == max_retries - 1:
+                if attempt == max_retries - 1 or not Deadline.allows(2 ** attempt):
                     Log.error("Rootly request failed after retries", path=path, err=str(e))
                     raise
+                Metrics.count("rootly.retries")
                 time.sleep(2 ** attempt)
         raise RuntimeError("Unreachable")
 
+    @Metrics.timed("rootly_post")
     def post_incident_event(self, incident_id: str, message: str):
         path = f"/v1/incidents/{incident_id}/events"
         payload = {"data": {"type": "incident_events",
@@ -292,30 +1292,48 @@ class RootlyClient:
 
     def list_incident_field_selections(self, incident_id: str, field_id: str) -> Optional[str]:
         Log.info("Listing incident field selections", incident_id=incident_id, field_id=field_id)
-        qs = (
+        path: Optional[str] = (
             f"/v1/incidents/{incident_id}/form_field_selections"
             f"?filter[form_field_id]={field_id}"
             f"&page[size]=50"
             f"&fields[incident_form_field_selections]=id,attributes"
         )
         try:
-            r = self.request("GET", qs)
-            if r.status_code // 100 == 2:
-                data = (r.json() or {}).get("data") or []
-                for item in data:
+            for page in range(1, max(1, Config.SELECTION_LIST_MAX_PAGES) + 1):
+                r = self.request("GET", path)
+                if r.status_code // 100 != 2:
+                    Log.warn("List selections non-2xx", code=r.status_code, body=(r.text or "")[:300])
+                    return ""
+                doc = r.json() or {}
+                for item in doc.get("data") or []:
                     attrs = (item or {}).get("attributes", {})
                     sel_id = (item or {}).get("id") or ""
                     ffid = attrs.get("form_field_id") or ""
                     if ffid == field_id:
-                        Log.info("Selection found", selection_id=sel_id)
+                        Log.info("Selection found", selection_id=sel_id, page=page)
                         return sel_id
-                Log.info("No selection for field", field_id=field_id)
-                return ""
-            Log.warn("List selections non-2xx", code=r.status_code, body=(r.text or "")[:300])
+                path = self._next_page_path(doc)
+                if not path:
+                    Log.info("No selection for field", field_id=field_id, pages=page)
+                    return ""
+            Log.warn("List selections page limit reached", field_id=field_id,
+                    max_pages=Config.SELECTION_LIST_MAX_PAGES)
         except Exception as e:
             Log.warn("List selections error", err=str(e))
         return ""
 
+    def _next_page_path(self, doc: Dict[str, Any]) -> Optional[str]:
+        """JSON:API links.next as a path for request(); None on the last page."""
+        nxt = (doc.get("links") or {}).get("next")
+        if not nxt or not isinstance(nxt, str):
+            return None
+        if nxt.startswith(self.base):
+            return nxt[len(self.base):]
+        if nxt.startswith("http"):
+            parts = nxt.split("/", 3)
+            return "/" + parts[3] if len(parts) > 3 else None
+        return nxt
+
     def patch_selection_value(self, selection_id: str, value: str) -> int:
         payload = {"data": {"type": "incident_form_field_selections",
                             "id": selection_id,
@@ -325,13 +1343,20 @@ class RootlyClient:
         Log.info("Patch selection response", status=r.status_code)
         return r.status_code
 
-    def create_selection(self, incident_id: str, field_id: str, value: str) -> int:
+    def create_selection(self, incident_id: str, field_id: str, value: str) -> tuple[int, str]:
+        """Returns (status, new selection id or "")."""
         payload = {"data": {"type": "incident_form_field_selections",
                             "attributes": {"value": value, "form_field_id": field_id}}}
         Log.info("Creating selection", incident_id=incident_id, field_id=field_id)
         r = self.request("POST", f"/v1/incidents/{incident_id}/form_field_selections", json=payload)
-        Log.info("Create selection response", status=r.status_code)
-        return r.status_code
+        sel_id = ""
+        if r.status_code // 100 == 2:
+            try:
+                sel_id = str(((r.json() or {}).get("data") or {}).get("id") or "")
+            except ValueError:
+                pass
+        Log.info("Create selection response", status=r.status_code, selection_id=sel_id or "(none)")
+        return r.status_code, sel_id
 
     def patch_incident_custom_fields(self, incident_id: str, slug: str, value: str) -> int:
         if not slug:
@@ -345,6 +1370,287 @@ class RootlyClient:
         return r.status_code
 
 
+# =========================
+# Rundeck output processing (single pass, streaming)
+# =========================
+class SectionRules:
+    """
+    Ordered section rules compiled into one alternation with a named group
+    per rule, so a single match both decides whether a line starts a new
+    section ("split") and which render group it belongs to. Rules are
+    matched case-insensitively at the start of the stripped line; the first
+    matching rule wins, lines matching none fall into `fallback`.
+
+    AppConfig shape (payload["outputSections"]):
+        {"rules": [{"group": "acct", "pattern": "cloud region:\\s*$", "split": true}, ...],
+         "order": ["acct", "fe", "iis", "db", "misc"], "fallback": "misc"}
+    """
+    # Reproduces the original O11 headers: split rules mirror the old
+    # SECTION_START regex, non-split ones classify a first line that is not
+    # a header (the old startswith/substring chain).
+    DEFAULT = {
+        "rules": [
+            {"group": "acct", "pattern": r"(?:cloud account id:|cloud region:)\s*$", "split": True},
+            {"group": "acct", "pattern": r"cloud account id:|cloud region:", "split": False},
+            {"group": "fe", "pattern": r"frontends of the environment:\s*$", "split": True},
+            {"group": "fe", "pattern": r"frontends of the environment:", "split": False},
+            # IIS app-pools section has a 15m/1m window in its header
+            {"group": "iis", "pattern": r"details for .*(?:last 15m|bucket aggregation of 1m)", "split": True},
+            {"group": "iis", "pattern": r"details for.*(?:last 15m|bucket aggregation of 1m)", "split": False},
+            # Frontend metrics (20m/24h windows)
+            {"group": "fe", "pattern": r"details for .*(?:2m|30m)", "split": True},
+            {"group": "fe", "pattern": r"details for.*(?:2m|30m)", "split": False},
+            {"group": "db", "pattern": r"database of the environment:\s*$", "split": True},
+            {"group": "db", "pattern": r"details for db", "split": True},
+            {"group": "db", "pattern": r"database of the environment:", "split": False},
+            {"group": "misc", "pattern": r"details for .", "split": True},
+        ],
+        "order": ["acct", "fe", "iis", "db", "misc"],
+        "fallback": "misc",
+    }
+
+    def __init__(self, spec: Dict[str, Any]):
+        rules = spec.get("rules") or []
+        if not rules:
+            raise ValueError("section rules: empty rule list")
+        self.fallback = str(spec.get("fallback") or "misc")
+        self.groups: List[str] = []
+        self.splits: List[bool] = []
+        alts = []
+        for i, rule in enumerate(rules):
+            group, pattern = str(rule.get("group") or ""), str(rule.get("pattern") or "")
+            if not group or not pattern:
+                raise ValueError(f"section rules: rule {i} needs group and pattern")
+            re.compile(pattern)  # report the offending rule, not the combined regex
+            alts.append(f"(?P<_r{i}>{pattern})")
+            self.groups.append(group)
+            self.splits.append(bool(rule.get("split", True)))
+        self.regex = re.compile("|".join(alts), re.IGNORECASE)
+        order = [str(g) for g in (spec.get("order") or [])]
+        for g in self.groups + [self.fallback]:
+            if g not in order:
+                order.append(g)
+        self.order = tuple(order)
+
+    def match(self, stripped_line: str) -> tuple:
+        """(group, starts_section) for a stripped line."""
+        m = self.regex.match(stripped_line)
+        if m is None:
+            return self.fallback, False
+        i = int(m.lastgroup[2:])
+        return self.groups[i], self.splits[i]
+
+
+class OutputParser:
+    """
+    Single-pass, streaming cleanup of Rundeck log entries. Built once at
+    import (OUTPUT_PARSER) with every pattern precompiled; start() returns
+    the per-execution state that entries are fed into. Each entry goes
+    straight through timestamp strip, line cleanup, KV-table extraction,
+    consecutive/block de-dupe and section de-dupe + grouping, so no full
+    intermediate copy of the output is ever built. Output is identical to
+    the former multi-pass implementation.
+    """
+    TIMESTAMP_RE = re.compile(r'^\d{2}:\d{2}:\d{2}\s+')
+    RULE_RE = re.compile(r'-{3,}$')
+    KV_COLUMNS_RE = re.compile(r'\s{2,}')
+    WS_RE = re.compile(r'\s+')
+    GROUP_SEP = "\n\n-----------------------\n\n"
+
+    def __init__(self, sections: Optional[SectionRules] = None):
+        self.sections = sections or SectionRules(SectionRules.DEFAULT)
+
+    def configure_sections(self, spec: Optional[Dict[str, Any]]) -> None:
+        """Swap in section rules (e.g. from AppConfig); runs already started keep theirs."""
+        self.sections = SectionRules(spec) if spec else SectionRules(SectionRules.DEFAULT)
+
+    def start(self) -> "OutputParse":
+        return OutputParse(self)
+
+    def parse(self, entries: List[Dict[str, Any]]) -> str:
+        run = self.start()
+        run.feed(entries)
+        return run.render()
+
+
+class OutputParse:
+    """Per-execution state of OutputParser; feed() any number of times, then render() once."""
+    def __init__(self, parser: OutputParser):
+        self.p = parser
+        self.rules = parser.sections
+        self.result: Optional[str] = None
+        self._reset()
+
+    def _reset(self):
+        # entry level: current block of kept lines + KV table state
+        self.section: List[str] = []
+        self.in_kv = False
+        self.in_value = False
+        # kept-line level: consecutive de-dupe
+        self.last_item: Optional[str] = None
+        self.items = 0
+        # physical-line level: blank-line separated blocks
+        self.block: List[str] = []
+        self.seen_blocks: set = set()
+        self.blocks = 0
+        # block level: header-delimited sections, de-duped by first line and grouped
+        self.cur: Optional[List[str]] = None
+        self.cur_group = ""
+        self.in_section = False
+        self.seen_headers: set = set()
+        self.sections = 0
+        self.groups: Dict[str, List[str]] = {g: [] for g in self.rules.order}
+
+    def feed(self, entries: List[Dict[str, Any]]) -> None:
+        p = self.p
+        for e in entries:
+            raw = (e or {}).get("log", "")
+            if raw[:1].isdigit():
+                raw = p.TIMESTAMP_RE.sub('', raw, count=1)
+            line = _clean_line(raw)
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            # horizontal rule between blocks
+            if p.RULE_RE.match(stripped):
+                if self.in_kv:
+                    self.in_kv = False
+                    self.in_value = False
+                self._flush_section()
+                continue
+            if "key value data: results" in line.lower():
+                Log.info("KV table detected in Rundeck output — keeping only VALUE column and discarding pre-table text")
+                self._reset()
+                self.in_kv = True
+                continue
+
+            if self.in_kv:
+                hdr = stripped.lower()
+                if hdr == "key":
+                    # ignore header cell
+                    continue
+                if hdr == "value":
+                    self.in_value = True
+                    continue
+                if self.in_value:
+                    val_text = p.KV_COLUMNS_RE.split(line)[-1]
+                    if val_text.strip():
+                        self.section.append(val_text)
+                continue
+            self.section.append(line)
+
+    def _flush_section(self):
+        if self.section:
+            for item in self.section:
+                self._item(item)
+            self._item("")
+        self.section = []
+
+    def _item(self, item: str):
+        if item == self.last_item:
+            return
+        self.last_item = item
+        self.items += 1
+        if "\n" in item or "\r" in item:
+            for ln in item.replace("\r\n", "\n").split("\n"):
+                self._line(ln)
+        else:
+            self._line(item)
+
+    def _line(self, ln: str):
+        # a line of only spaces/tabs separates blocks
+        if ln.strip(" \t"):
+            self.block.append(ln)
+        elif self.block:
+            self._flush_block()
+
+    def _flush_block(self):
+        b = "\n".join(self.block).strip()
+        self.block = []
+        if not b:
+            return
+        key = self.p.WS_RE.sub(' ', b.lower())
+        if key in self.seen_blocks:
+            return
+        self.seen_blocks.add(key)
+        if self.blocks:
+            self._section_line("")
+        self.blocks += 1
+        for ln in b.split("\n"):
+            self._section_line(ln)
+
+    def _section_line(self, ln: str):
+        group, split = self.rules.match(ln.strip()) if ln else (self.rules.fallback, False)
+        if self.in_section and not split:
+            if self.cur is not None:
+                self.cur.append(ln)
+            return
+        self._close_section()
+        self.in_section = True
+        self.sections += 1
+        norm = self.p.WS_RE.sub(' ', ln.strip().lower())
+        if norm in self.seen_headers:
+            self.cur = None
+            return
+        self.seen_headers.add(norm)
+        self.cur = [ln]
+        self.cur_group = group
+
+    def _close_section(self):
+        if self.cur is not None:
+            self.groups[self.cur_group].append("\n".join(self.cur).strip())
+        self.cur = None
+
+    def render(self) -> str:
+        if self.result is not None:
+            return self.result
+        self._flush_section()
+        if self.block:
+            self._flush_block()
+        self._close_section()
+
+        # Render groups with a separator line between them
+        ordered_text_blocks = ["\n\n".join(xs).strip() for xs in
+                            (self.groups[g] for g in self.rules.order) if xs]
+        self.result = self.p.GROUP_SEP.join(ordered_text_blocks).strip()
+
+        kept = sum(len(xs) for xs in self.groups.values())
+        Log.info("Section de-dupe", sections_before=max(1, self.sections), sections_after=max(1, kept))
+        Log.info("Rundeck output parsed", lines=self.items, size=len(self.result))
+        return self.result
+
+
+OUTPUT_PARSER = OutputParser()
+
+
+class OutputTail:
+    """Offset/lastmod cursor for tailing one execution's log while it runs."""
+    def __init__(self, execution_id: str):
+        self.execution_id = str(execution_id)
+        self.offset = "0"
+        self.lastmod = ""
+        self.exec_completed = False
+        self.completed = False
+        self.more = False
+        self.exec_state = ""
+        self.entries_seen = 0
+        self.recent: List[str] = []
+        self._acc = OUTPUT_PARSER.start()
+
+    def feed(self, entries: List[Dict[str, Any]]) -> None:
+        self.entries_seen += len(entries)
+        self._acc.feed(entries)
+        for e in entries[-Config.POLL_PROGRESS_LINES:]:
+            line = _clean_line((e or {}).get("log", ""))
+            if line.strip():
+                self.recent.append(line)
+        self.recent = self.recent[-Config.POLL_PROGRESS_LINES:]
+
+    def render(self) -> str:
+        return self._acc.render()
+
+
 # =========================
 # Rundeck Client & Errors
 # =========================
@@ -360,6 +1666,7 @@ class RundeckClient:
         if not Config.RUNDECK_API_TOKEN:
             Log.warn("RUNDECK_API_TOKEN_Community missing (requests may fail)")
         self.base = Config.RUNDECK_URL
+        self._session = None
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -367,13 +1674,26 @@ class RundeckClient:
             "Rundeck-GitHub-Action": Config.GITHUB_ACTION_ID,
         }
 
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            self._session = _BreakerClient(
+                _TimedClient(_DeadlineSession("rundeck", status_forcelist=(502, 503, 504)), "rundeck"),
+                circuit_breaker("rundeck"))
+        return self._session
+
+    @session.setter
+    def session(self, s):
+        self._session = s
+
+    @Metrics.timed("rundeck_start")
     def start_job(self, job_id: str, options: Dict[str, str]) -> str:
         url = f"{self.base}/job/{job_id}/run"
         payload = {"project": Config.RUNDECK_PROJECT, "options": options}
         Log.info("Rundeck start_job begin", url=url, job_id=job_id, project=Config.RUNDECK_PROJECT, options=options)
         
         # Make the request
-        r = requests.post(url, headers=self.headers, json=payload, timeout=Config.TIMEOUT)
+        r = self.session.post(url, headers=self.headers, json=payload, timeout=Deadline.timeout(Config.TIMEOUT))
         
         # CRITICAL FIX: Save response text IMMEDIATELY
         response_text = r.text
@@ -400,28 +1720,194 @@ class RundeckClient:
             raise RundeckStartError(502, "Rundeck start succeeded but no execution id in response")
         return exec_id
 
-    def poll_until_done(self, execution_id: str) -> Dict[str, Any]:
+    @staticmethod
+    def _poll_delays(expected: Optional[Dict[str, float]]):
+        """
+        Sleep before each state check. With POLL_ADAPTIVE off this is the
+        fixed schedule: check now, then every POLLING_INTERVAL. Adaptive
+        checks back off exponentially from POLL_MIN_INTERVAL to
+        POLL_MAX_INTERVAL, with jitter; with history the first check lands
+        near the job's typical finish (p50/EWMA), without it it is immediate.
+        """
+        if not Config.POLL_ADAPTIVE:
+            yield 0.0
+            while True:
+                yield float(Config.POLLING_INTERVAL)
+
+        def jitter(x: float) -> float:
+            return max(0.0, x * random.uniform(1 - Config.POLL_JITTER, 1 + Config.POLL_JITTER))
+
+        typical = (expected or {}).get("p50") or (expected or {}).get("ewma") or 0.0
+        yield jitter(typical * Config.POLL_FIRST_CHECK_FACTOR) if typical > 0 else 0.0
+        interval = Config.POLL_MIN_INTERVAL
+        while True:
+            yield jitter(interval)
+            interval = min(Config.POLL_MAX_INTERVAL, interval * Config.POLL_BACKOFF_FACTOR)
+
+    def poll_until_done(self, execution_id: str, expected: Optional[Dict[str, float]] = None,
+                        tail: Optional[OutputTail] = None,
+                        on_progress: Optional[Callable[[OutputTail, float], None]] = None,
+                        started: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the execution to complete. With a tail, each tick reads new
+        log entries from the output endpoint (which also reports execution
+        state) so parsing overlaps the job's runtime; on_progress is then
+        called at most every POLL_PROGRESS_SECONDS with the tail.
+
+        `started` (epoch) is when polling began in an earlier invocation, so
+        the overall budget survives hand-offs. Raises DeadlineExceeded when
+        the next sleep would leave less than DEADLINE_HANDOFF_SECONDS.
+        """
         url = f"{self.base}/execution/{execution_id}/state"
+        budget = Config.MAX_RETRIES * Config.POLLING_INTERVAL
         Log.info("Rundeck polling begin", execution_id=execution_id, url=url,
-                max_retries=Config.MAX_RETRIES, interval=Config.POLLING_INTERVAL)
+                max_retries=Config.MAX_RETRIES, interval=Config.POLLING_INTERVAL,
+                budget_s=budget, expected_p50=(expected or {}).get("p50"), tailing=tail is not None)
+        t0 = started or time.time()
+        last_progress = time.time()
+        delays = self._poll_delays(expected)
         for attempt in range(Config.MAX_RETRIES):
-            r = requests.get(url, headers=self.headers, timeout=Config.TIMEOUT)
-            Log.info("Rundeck poll tick", attempt=attempt+1, status=r.status_code)
-            r.raise_for_status()
-            data = r.json()
+            delay = min(next(delays), max(0.0, budget - (time.time() - t0)))
+            if Deadline.remaining() - delay < Config.DEADLINE_HANDOFF_SECONDS:
+                Log.warn("Rundeck poll stopped at deadline", execution_id=execution_id, attempt=attempt+1,
+                        remaining=round(Deadline.remaining(reserve=False), 2))
+                raise DeadlineExceeded(f"Rundeck execution {execution_id} still running", started=t0)
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                if tail is not None:
+                    data = self.tail_output(tail)
+                    while tail.more and not tail.exec_completed:
+                        data = self.tail_output(tail)
+                    Log.info("Rundeck poll tick", attempt=attempt+1, slept=round(delay, 2), offset=tail.offset)
+                    Metrics.count("rundeck.poll_ticks")
+                    if (on_progress and Config.POLL_PROGRESS_SECONDS > 0 and not data.get("completed")
+                            and time.time() - last_progress >= Config.POLL_PROGRESS_SECONDS):
+                        last_progress = time.time()
+                        on_progress(tail, last_progress - t0)
+                else:
+                    r = self.session.get(url, headers=self.headers, timeout=Deadline.timeout(Config.TIMEOUT))
+                    Log.info("Rundeck poll tick", attempt=attempt+1, status=r.status_code, slept=round(delay, 2))
+                    Metrics.count("rundeck.poll_ticks")
+                    r.raise_for_status()
+                    data = r.json()
+            except (CircuitOpenError, requests.ConnectionError, requests.Timeout) as e:
+                # The job keeps running while Rundeck is unreachable; keep to the schedule and budget
+                Log.warn("Rundeck poll tick skipped (unreachable)", execution_id=execution_id,
+                        attempt=attempt+1, err=str(e))
+                Metrics.count("rundeck.poll_ticks_skipped")
+                data = {}
             if data.get("completed"):
-                Log.info("Rundeck poll complete", execution_id=execution_id, final_state=data.get("executionState"))
+                Log.info("Rundeck poll complete", execution_id=execution_id, final_state=data.get("executionState"),
+                        ticks=attempt+1, elapsed=round(time.time() - t0, 2))
                 return data
-            if attempt == Config.MAX_RETRIES - 1:
+            if attempt == Config.MAX_RETRIES - 1 or time.time() - t0 >= budget:
                 Log.error("Rundeck poll timeout", execution_id=execution_id)
                 raise TimeoutError(f"Rundeck execution {execution_id} not complete within timeout")
-            time.sleep(Config.POLLING_INTERVAL)
         return {}
 
-    def fetch_output(self, execution_id: str) -> str:
+    def list_running_execution_ids(self) -> set:
+        """All running executions of the project, via the bulk (paged) running-executions query."""
+        url = f"{self.base}/project/{Config.RUNDECK_PROJECT}/executions/running"
+        ids, offset, page = set(), 0, 200
+        while True:
+            r = self.session.get(url, headers=self.headers, params={"max": page, "offset": offset},
+                                timeout=Deadline.timeout(Config.TIMEOUT))
+            r.raise_for_status()
+            j = r.json() or {}
+            execs = j.get("executions") or []
+            ids.update(str((x or {}).get("id")) for x in execs if (x or {}).get("id") is not None)
+            total = int((j.get("paging") or {}).get("total") or 0)
+            offset += len(execs)
+            if not execs or offset >= total:
+                break
+        Log.info("Rundeck running executions listed", count=len(ids))
+        return ids
+
+    def get_execution(self, execution_id: str) -> Dict[str, Any]:
+        r = self.session.get(f"{self.base}/execution/{execution_id}", headers=self.headers, timeout=Deadline.timeout(Config.TIMEOUT))
+        r.raise_for_status()
+        return r.json() or {}
+
+    def get_job_options(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Option schema from the job definition: name -> {required, values,
+        enforced, regex, default, multivalued, delimiter}.
+        """
+        r = self.session.get(f"{self.base}/job/{job_id}", params={"format": "json"},
+                            headers=self.headers, timeout=Deadline.timeout(Config.TIMEOUT))
+        r.raise_for_status()
+        doc = r.json() or []
+        job = (doc[0] if isinstance(doc, list) and doc else doc) or {}
+        raw = job.get("options") or []
+        if isinstance(raw, dict):  # older exports key options by name
+            raw = [{"name": k, **(v or {})} for k, v in raw.items()]
+        schema: Dict[str, Dict[str, Any]] = {}
+        for o in raw:
+            name = (o or {}).get("name")
+            if not name:
+                continue
+            values = o.get("values") or []
+            if isinstance(values, str):
+                values = [v.strip() for v in values.split(",") if v.strip()]
+            schema[name] = {
+                "required": bool(o.get("required")),
+                "values": [str(v) for v in values],
+                "enforced": bool(o.get("enforced")),
+                "regex": o.get("regex") or "",
+                "default": "" if o.get("value") is None else str(o.get("value")),
+                "multivalued": bool(o.get("multivalued")),
+                "delimiter": o.get("delimiter") or ",",
+            }
+        Log.info("Rundeck job options fetched", job_id=job_id, options=len(schema),
+                required=[n for n, o in schema.items() if o["required"]])
+        return schema
+
+    def tail_output(self, tail: "OutputTail") -> Dict[str, Any]:
+        """
+        One incremental read of /execution/{id}/output from the tail's offset.
+        The response also carries execution state, so a tailing poll tick
+        needs no separate /state call. Returns a /state-shaped dict.
+        """
+        url = f"{self.base}/execution/{tail.execution_id}/output"
+        params = {"offset": tail.offset, "maxlines": Config.POLL_TAIL_MAXLINES}
+        if tail.lastmod:
+            params["lastmod"] = tail.lastmod
+        r = self.session.get(url, headers=self.headers, params=params, timeout=Deadline.timeout(Config.TIMEOUT))
+        r.raise_for_status()
+        j = r.json() or {}
+        entries = j.get("entries") or []
+        tail.offset = str(j.get("offset") or tail.offset)
+        tail.lastmod = str(j.get("lastModified") or tail.lastmod or "")
+        tail.exec_completed = bool(j.get("execCompleted"))
+        tail.completed = bool(j.get("completed")) and tail.exec_completed
+        tail.exec_state = str(j.get("execState") or tail.exec_state or "")
+        tail.more = len(entries) >= Config.POLL_TAIL_MAXLINES
+        tail.feed(entries)
+        Log.info("Rundeck output tail", execution_id=tail.execution_id, new_entries=len(entries),
+                offset=tail.offset, exec_completed=tail.exec_completed, log_completed=tail.completed)
+        return {"completed": tail.exec_completed, "executionState": tail.exec_state.upper()}
+
+    @Metrics.timed("fetch_output")
+    def fetch_output(self, execution_id: str, tail: Optional["OutputTail"] = None) -> str:
+        if tail is not None:
+            # Entries were parsed while polling; only drain what is left
+            drains = 0
+            while not tail.completed and drains < Config.MAX_RETRIES:
+                self.tail_output(tail)
+                drains += 1
+                if not tail.completed and not tail.more:
+                    if not Deadline.allows(1):
+                        Log.warn("Rundeck output drain stopped at deadline", execution_id=execution_id)
+                        break
+                    time.sleep(1)
+            Log.info("Rundeck output assembled from tail", execution_id=execution_id,
+                    entries=tail.entries_seen, drain_requests=drains)
+            return tail.render()
+
         url = f"{self.base}/execution/{execution_id}/output"
         Log.info("Fetching Rundeck output", execution_id=execution_id, url=url)
-        r = requests.get(url, headers=self.headers, timeout=Config.TIMEOUT)
+        r = self.session.get(url, headers=self.headers, timeout=Deadline.timeout(Config.TIMEOUT))
         Log.info("Rundeck output response", status=r.status_code)
         r.raise_for_status()
         try:
@@ -430,197 +1916,334 @@ class RundeckClient:
         except ValueError:
             Log.warn("Rundeck output non-JSON; returning raw text", size=len(r.text or ""))
             return (r.text or "").strip()[:8000]
-        keep: List[str] = []
-
-        section: List[str] = []
-        in_kv = False
-        in_value = False
+        return OUTPUT_PARSER.parse(entries)
+
 
-        def flush_section():
-            if section:
-                keep.extend(section)
-                keep.append("")
-
-        for e in entries:
-            raw = (e or {}).get("log", "")
-            line = re.sub(r'^\d{2}:\d{2}:\d{2}\s+', '', raw)
-            line = _clean_line(line)
-            if not line.strip():
-                continue
-
-            # horizontal rule between blocks
-            if re.match(r'-{3,}$', line.strip()):
-                if in_kv:
-                    in_kv = False
-                    in_value = False
-                flush_section()
-                section = []
-                continue
-            if "key value data: results" in line.lower():
-                Log.info("KV table detected in Rundeck output — keeping only VALUE column and discarding pre-table text")
-                keep = []
-                section = []
-                in_kv = True
-                in_value = False
-                continue
-
-            hdr = line.strip().lower()
-            if in_kv and hdr == "key":
-                # ignore header cell
-                continue
-            if in_kv and hdr == "value":
-                in_value = True
-                continue
-            if in_kv:
-                if in_value:
-                    parts = re.split(r'\s{2,}', line)
-                    if parts:
-                        val_text = parts[-1]
-                        if val_text.strip():
-                            section.append(val_text)
-                continue
-            section.append(line)
-
-        flush_section()
-        deduped: List[str] = []
-        for s in keep:
-            if not deduped or s != deduped[-1]:
-                deduped.append(s)
-        out = "\n".join(deduped).replace("\r\n", "\n").strip()
-        out = re.sub(r'\n[ \t]*\n+', '\n\n', out)
-        blocks = [b.strip() for b in re.split(r'\n\n+', out) if b.strip()]
-        seen, uniq = set(), []
-        for b in blocks:
-            key = re.sub(r'\s+', ' ', b.lower().strip())
-            if key not in seen:
-                seen.add(key)
-                uniq.append(b)
-
-        out = "\n\n".join(uniq)
-        # -----------------------------------------------------------------
-
-        # === Section-aware de-dupe + group separators ===
-        SECTION_START = re.compile(
-            r'^(?:'
-            r'Cloud Account ID:|'
-            r'Cloud Region:|'
-            r'Frontends of the environment:|'
-            r'Database of the environment:|'
-            r'Details for [^\n]+'
-            r')\s*$',
-            re.IGNORECASE
-        )
-
-        # 1) Split output into sections at known headers
-        lines = out.split("\n")
-        sections, cur = [], []
-        for ln in lines:
-            if SECTION_START.match(ln.strip()):
-                if cur:
-                    sections.append("\n".join(cur).strip())
-                    cur = []
-            cur.append(ln)
-        if cur:
-            sections.append("\n".join(cur).strip())
-
-        # 2) Keep only the first occurrence of each section (by normalized first line)
-        seen_headers, uniq_sections = set(), []
-        for sec in sections:
-            first_line = sec.split("\n", 1)[0]
-            first_line_norm = re.sub(r'\s+', ' ', first_line.strip().lower())
-            if first_line_norm in seen_headers:
-                continue
-            seen_headers.add(first_line_norm)
-            uniq_sections.append(sec)
-
-        # 3) Classify sections into the four visual groups we want
-        def classify(header: str) -> str:
-            h = header.strip().lower()
-            if h.startswith("cloud account id:") or h.startswith("cloud region:"):
-                return "acct"
-            if h.startswith("frontends of the environment:"):
-                return "fe"
-            # IIS app-pools section has a 15m/1m window in its header
-            if h.startswith("details for") and ("last 15m" in h or "bucket aggregation of 1m" in h):
-                return "iis"
-            # Frontend metrics (20m/24h windows)
-            if h.startswith("details for") and ("2m" in h or "30m" in h):
-                return "fe"
-            if h.startswith("database of the environment:") or h.startswith("details for db"):
-                return "db"
-            return "misc"
-
-        groups = {"acct": [], "fe": [], "iis": [], "db": [], "misc": []}
-        for sec in uniq_sections:
-            header = sec.split("\n", 1)[0]
-            groups[classify(header)].append(sec)
-
-        def join_group(xs: list[str]) -> str:
-            return "\n\n".join(xs).strip()
-
-        # 4) Render groups with a separator line between them
-        SEP = "\n\n-----------------------\n\n"
-        ordered_text_blocks = []
-        for key in ("acct", "fe", "iis", "db"):
-            if groups[key]:
-                ordered_text_blocks.append(join_group(groups[key]))
-        if groups["misc"]:
-            ordered_text_blocks.append(join_group(groups["misc"]))
-
-        out = SEP.join(ordered_text_blocks).strip()
-
-        Log.info("Section de-dupe", sections_before=len(sections), sections_after=len(uniq_sections))
-        # === end section-aware de-dupe + group separators ===
-
-        Log.info("Rundeck output parsed", lines=len(deduped), size=len(out))
-        return out
 # =========================
 # DynamoDB helpers (short-window dedupe)
 # =========================
+class GuardL1Cache:
+    """
+    Bounded in-process LRU of guard pk -> last known acquisition ts. A guard
+    whose ts is still inside the caller's window is known to be held, so the
+    duplicate can be suppressed without a DynamoDB round trip. Only positive
+    "held" knowledge is cached; anything unknown or stale goes to the table.
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._d: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def held(self, pk: str, cutoff: int) -> bool:
+        with self._lock:
+            ts = self._d.get(pk)
+            if ts is not None and ts >= cutoff:
+                self._d.move_to_end(pk)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def remember(self, pk: str, ts: int) -> None:
+        with self._lock:
+            if ts >= self._d.get(pk, ts):
+                self._d[pk] = ts
+            self._d.move_to_end(pk)
+            while len(self._d) > self.max_entries:
+                self._d.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"l1_hits": self.hits, "l1_misses": self.misses, "l1_size": len(self._d)}
+
+
+_GUARD_L1 = GuardL1Cache(Config.GUARD_L1_MAX_ENTRIES)
+
+
+def _held_ts(item: Optional[Dict[str, Any]]) -> Optional[int]:
+    try:
+        return int(((item or {}).get("ts") or {}).get("N"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    idx = max(0, min(len(sorted_vals) - 1, math.ceil(q / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[idx]
+
+
 class DDB:
     def __init__(self):
-        self.c = boto3.client("dynamodb")
+        self._c = None
         self.table = Config.DDB_TABLE
 
+    @property
+    def c(self):
+        # Built on first DynamoDB call so events that return early never load boto3
+        if self._c is None:
+            self._c = _aws_client("dynamodb")
+        return self._c
+
+    @c.setter
+    def c(self, client):
+        self._c = client
+
+    def _guard_update(self, incident_id: str, job_key: str, ttl_seconds: Optional[int], now: int) -> Dict[str, Any]:
+        """
+        One conditional upsert per guard: creates the item when absent and
+        refreshes it once the previous acquisition is older than the window.
+        """
+        ttl_s = ttl_seconds if ttl_seconds is not None else Config.REM_GUARD_TTL
+        return {
+            "TableName": self.table,
+            "Key": {'incident_id': {'S': self._guard_pk(incident_id, job_key)}},
+            "UpdateExpression": "SET #ts = :now, #ttl = :ttl",
+            "ConditionExpression": "attribute_not_exists(#ts) OR #ts < :cutoff",
+            "ExpressionAttributeNames": {'#ts': 'ts', '#ttl': 'ttl'},
+            "ExpressionAttributeValues": {
+                ':now': {'N': str(now)}, ':ttl': {'N': str(now + ttl_s)}, ':cutoff': {'N': str(now - ttl_s)}
+            },
+            # lets a conditional failure tell us how long the holder keeps the guard (feeds the L1)
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }
+
+    @staticmethod
+    def _guard_pk(incident_id: str, job_key: str) -> str:
+        return f"rem_guard#{incident_id}#{job_key or 'nokey'}"
+
+    @staticmethod
+    def _guard_cutoff(ttl_seconds: Optional[int], now: int) -> int:
+        return now - (ttl_seconds if ttl_seconds is not None else Config.REM_GUARD_TTL)
+
     def acquire_rem_guard(self, incident_id: str, job_key: str, ttl_seconds: Optional[int] = None) -> bool:
         now = int(time.time())
-        ttl_s = ttl_seconds if ttl_seconds is not None else Config.REM_GUARD_TTL
-        ttl = now + ttl_s
-        cutoff = now - ttl_s
-        pk = f"rem_guard#{incident_id}#{job_key or 'nokey'}"
-        try:
-            self.c.put_item(
-                TableName=self.table,
-                Item={'incident_id': {'S': pk}, 'ts': {'N': str(now)}, 'ttl': {'N': str(ttl)}},
-                ConditionExpression="attribute_not_exists(incident_id)"
-            )
-            Log.info("Rem guard created", pk=pk)
-            return True
-        except ClientError as e:
-            if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
-                Log.warn("Rem guard put error", err=str(e))
-                return True if Config.FAIL_OPEN_ON_DDB_ERROR else False
+        pk = self._guard_pk(incident_id, job_key)
+        if _GUARD_L1.held(pk, self._guard_cutoff(ttl_seconds, now)):
+            Log.info("Rem guard hit (L1); duplicate suppressed", pk=pk, **_GUARD_L1.stats())
+            Metrics.count("guard.l1_hits")
+            Metrics.count("guard.held")
+            return False
+        upd = self._guard_update(incident_id, job_key, ttl_seconds, now)
         try:
-            self.c.update_item(
-                TableName=self.table,
-                Key={'incident_id': {'S': pk}},
-                UpdateExpression="SET #ts = :now, #ttl = :ttl",
-                ConditionExpression="attribute_not_exists(#ts) OR #ts < :cutoff",
-                ExpressionAttributeNames={'#ts': 'ts', '#ttl': 'ttl'},
-                ExpressionAttributeValues={
-                    ':now': {'N': str(now)}, ':ttl': {'N': str(ttl)}, ':cutoff': {'N': str(cutoff)}
-                },
-                ReturnValues="NONE"
-            )
-            Log.info("Rem guard refreshed (window elapsed)", pk=pk)
+            r = self.c.update_item(ReturnValues="UPDATED_OLD", **upd)
+            _GUARD_L1.remember(pk, now)
+            Metrics.count("guard.acquired")
+            if r.get("Attributes"):
+                Log.info("Rem guard refreshed (window elapsed)", pk=pk)
+            else:
+                Log.info("Rem guard created", pk=pk)
             return True
-        except ClientError as e:
+        except _botocore_exceptions.ClientError as e:
             if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                held_ts = _held_ts(e.response.get("Item"))
+                if held_ts is not None:
+                    _GUARD_L1.remember(pk, held_ts)
                 Log.info("Rem guard hit; duplicate suppressed", pk=pk)
+                Metrics.count("guard.held")
                 return False
             Log.warn("Rem guard update error", err=str(e))
             return True if Config.FAIL_OPEN_ON_DDB_ERROR else False
 
+    @Metrics.timed("guards")
+    def acquire_rem_guards(self, incident_id: str, guards: Dict[str, Optional[int]],
+                        all_or_nothing: bool = False) -> Dict[str, Optional[bool]]:
+        """
+        Acquire several rem guards (job_key -> ttl_seconds) with a single
+        TransactWriteItems call, keeping acquire_rem_guard's window semantics.
+
+        Per-key outcome: True acquired, False held (duplicate), None not
+        written because the batch was abandoned (all_or_nothing) or errored.
+        A transaction is all-or-nothing, so when some keys are held and
+        all_or_nothing is False the free keys are retried without them.
+        """
+        keys = [k for k in guards]
+        if len(keys) == 1:
+            return {keys[0]: self.acquire_rem_guard(incident_id, keys[0], guards[keys[0]])}
+        out: Dict[str, Optional[bool]] = {k: None for k in keys}
+        now = int(time.time())
+        pending = []
+        for k in keys:
+            if _GUARD_L1.held(self._guard_pk(incident_id, k), self._guard_cutoff(guards[k], now)):
+                out[k] = False
+            else:
+                pending.append(k)
+        if len(pending) < len(keys):
+            Log.info("Rem guard batch L1 hits", held=[k for k in keys if out[k] is False], **_GUARD_L1.stats())
+            Metrics.count("guard.l1_hits", len(keys) - len(pending))
+            if all_or_nothing:
+                Metrics.count("guard.held", len(keys) - len(pending))
+                return out
+        for _ in range(3):
+            if not pending:
+                break
+            now = int(time.time())
+            items = [{"Update": self._guard_update(incident_id, k, guards[k], now)} for k in pending]
+            try:
+                self.c.transact_write_items(TransactItems=items)
+                for k in pending:
+                    out[k] = True
+                    _GUARD_L1.remember(self._guard_pk(incident_id, k), now)
+                pending = []
+                break
+            except _botocore_exceptions.ClientError as e:
+                err = e.response.get('Error', {})
+                if err.get('Code') != 'TransactionCanceledException':
+                    Log.warn("Rem guard batch error", err=str(e), keys=keys)
+                    fallback = True if Config.FAIL_OPEN_ON_DDB_ERROR else False
+                    return {k: (fallback if out[k] is None else out[k]) for k in keys}
+                reasons = e.response.get('CancellationReasons') or [{}] * len(pending)
+                retry = []
+                for k, reason in zip(pending, reasons):
+                    if (reason or {}).get('Code') == 'ConditionalCheckFailed':
+                        out[k] = False
+                        held_ts = _held_ts(reason.get("Item"))
+                        if held_ts is not None:
+                            _GUARD_L1.remember(self._guard_pk(incident_id, k), held_ts)
+                    else:
+                        retry.append(k)
+                if all_or_nothing and any(v is False for v in out.values()):
+                    pending = []
+                    break
+                pending = retry
+        if pending:
+            Log.warn("Rem guard batch unresolved after retries", keys=pending)
+            for k in pending:
+                out[k] = True if Config.FAIL_OPEN_ON_DDB_ERROR else False
+        Log.info("Rem guard batch resolved", incident_id=incident_id,
+                outcomes={k: out[k] for k in keys})
+        Metrics.count("guard.acquired", sum(1 for k in keys if out[k]))
+        Metrics.count("guard.held", sum(1 for k in keys if out[k] is False))
+        return out
+
+    # ---------- per-job runtime history (drives adaptive polling) ----------
+    def get_job_runtime_stats(self, job_id: str) -> Dict[str, float]:
+        pk = f"job_stats#{job_id}"
+        try:
+            item = self.c.get_item(TableName=self.table, Key={'incident_id': {'S': pk}}).get("Item") or {}
+        except _botocore_exceptions.ClientError as e:
+            Log.warn("Job stats read error", pk=pk, err=str(e))
+            return {}
+        samples = sorted(float(x["N"]) for x in (item.get("samples") or {}).get("L", []) if "N" in x)
+        if not samples:
+            return {}
+        return {
+            "ewma": float((item.get("ewma") or {}).get("N", samples[len(samples) // 2])),
+            "p50": _percentile(samples, 50),
+            "p90": _percentile(samples, 90),
+            "count": float((item.get("count") or {}).get("N", len(samples))),
+        }
+
+    def record_job_runtime(self, job_id: str, seconds: float, attempts: int = 3) -> None:
+        """Read-modify-write guarded by the previous `count`, retried when a concurrent completion wins."""
+        pk = f"job_stats#{job_id}"
+        for attempt in range(attempts):
+            try:
+                item = self.c.get_item(TableName=self.table, Key={'incident_id': {'S': pk}},
+                                       ConsistentRead=True).get("Item") or {}
+                samples = [x["N"] for x in (item.get("samples") or {}).get("L", []) if "N" in x]
+                prev = (item.get("ewma") or {}).get("N")
+                ewma = seconds if prev is None else (
+                    Config.JOB_STATS_ALPHA * seconds + (1 - Config.JOB_STATS_ALPHA) * float(prev))
+                samples = (samples + [f"{seconds:.2f}"])[-max(1, Config.JOB_STATS_WINDOW):]
+                prev_count = (item.get("count") or {}).get("N")
+                count = int(prev_count or "0") + 1
+                now = int(time.time())
+                if prev_count is None:
+                    cond = {'ConditionExpression': "attribute_not_exists(#c)",
+                            'ExpressionAttributeNames': {"#c": "count"}}
+                else:
+                    cond = {'ConditionExpression': "#c = :prev",
+                            'ExpressionAttributeNames': {"#c": "count"},
+                            'ExpressionAttributeValues': {":prev": {'N': prev_count}}}
+                self.c.put_item(TableName=self.table, Item={
+                    'incident_id': {'S': pk},
+                    'ts': {'N': str(now)},
+                    'ttl': {'N': str(now + Config.JOB_STATS_TTL_DAYS * 86400)},
+                    'ewma': {'N': f"{ewma:.2f}"},
+                    'count': {'N': str(count)},
+                    'samples': {'L': [{'N': x} for x in samples]},
+                }, **cond)
+                Log.info("Job runtime recorded", job_id=job_id, seconds=round(seconds, 2), ewma=round(ewma, 2), count=count)
+                return
+            except _botocore_exceptions.ClientError as e:
+                if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException' \
+                        and attempt < attempts - 1:
+                    continue
+                Log.warn("Job stats write error", pk=pk, err=str(e), attempt=attempt+1)
+                return
+
+    # ---------- pending executions (poll.sweep registry) ----------
+    def register_pending_execution(self, record: Dict[str, str]) -> None:
+        now = int(time.time())
+        item = {k: {'S': str(v)} for k, v in record.items() if v}
+        item.update({'created': {'N': str(now)},
+                    'ttl': {'N': str(now + Config.SWEEP_MAX_AGE_SECONDS + 3600)}})
+        self.c.put_item(TableName=Config.PENDING_EXECUTIONS_TABLE, Item=item)
+        Log.info("Pending execution registered", execution_id=record.get("execution_id"))
+
+    def scan_pending_executions(self) -> List[Dict[str, str]]:
+        out: List[Dict[str, str]] = []
+        kw: Dict[str, Any] = {"TableName": Config.PENDING_EXECUTIONS_TABLE}
+        while True:
+            r = self.c.scan(**kw)
+            for item in r.get("Items") or []:
+                out.append({k: (v.get("S") if "S" in v else v.get("N")) for k, v in item.items()})
+            if not r.get("LastEvaluatedKey"):
+                return out
+            kw["ExclusiveStartKey"] = r["LastEvaluatedKey"]
+
+    def claim_pending_execution(self, execution_id: str) -> bool:
+        """Conditional delete: exactly one overlapping sweep gets to finalize an execution."""
+        try:
+            self.c.delete_item(
+                TableName=Config.PENDING_EXECUTIONS_TABLE,
+                Key={'execution_id': {'S': execution_id}},
+                ConditionExpression="attribute_exists(execution_id)"
+            )
+            return True
+        except _botocore_exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                Log.warn("Pending execution claim error", execution_id=execution_id, err=str(e))
+            return False
+
+    # ---------- small persisted cache entries (string attributes + TTL) ----------
+    def get_cache_entry(self, key: str) -> Dict[str, str]:
+        pk = f"cache#{key}"
+        try:
+            r = self.c.get_item(TableName=self.table, Key={'incident_id': {'S': pk}})
+        except _botocore_exceptions.ClientError as e:
+            Log.warn("Cache entry read error", pk=pk, err=str(e))
+            return {}
+        item = r.get("Item") or {}
+        # DynamoDB TTL deletion is lazy; treat expired items as absent
+        expires = int((item.get("ttl") or {}).get("N", "0"))
+        if expires <= int(time.time()):
+            return {}
+        # string attributes, plus the entry's own expiry as "ttl" (epoch seconds)
+        values = {k: v["S"] for k, v in item.items() if k != "incident_id" and "S" in v}
+        values["ttl"] = str(expires)
+        return values
+
+    def put_cache_entry(self, key: str, values: Dict[str, str], ttl_seconds: int) -> None:
+        pk = f"cache#{key}"
+        now = int(time.time())
+        item = {'incident_id': {'S': pk}, 'ts': {'N': str(now)}, 'ttl': {'N': str(now + ttl_seconds)}}
+        item.update({k: {'S': str(v)} for k, v in values.items() if v})
+        try:
+            self.c.put_item(TableName=self.table, Item=item)
+        except _botocore_exceptions.ClientError as e:
+            Log.warn("Cache entry write error", pk=pk, err=str(e))
+
+    def delete_cache_entry(self, key: str) -> None:
+        pk = f"cache#{key}"
+        try:
+            self.c.delete_item(TableName=self.table, Key={'incident_id': {'S': pk}})
+        except _botocore_exceptions.ClientError as e:
+            Log.warn("Cache entry delete error", pk=pk, err=str(e))
+
 
 # =========================
 # Helpers (safe parsing & normalization)
@@ -731,6 +2354,7 @@ def _try_parse_single_kv_json(s: str) -> Optional[str]:
         obj = json.loads(t)
     except Exception:
         try:
+            import ast
             obj = ast.literal_eval(t)
         except Exception:
             return None
@@ -745,7 +2369,7 @@ def _try_parse_single_kv_json(s: str) -> Optional[str]:
     return None
 
 def _clean_line(s: str) -> str:
-    s = ANSI_RE.sub("", s).rstrip()
+    s = (ANSI_RE.sub("", s) if "\x1b" in s else s).rstrip()
     pretty = _try_parse_single_kv_json(s)
     return pretty if pretty is not None else s
 
@@ -756,7 +2380,8 @@ def classify_failure(text: str) -> str:
         return "CONFIGURATION_ERROR"
     if "missing required" in t or "required option" in t:
         return "MISSING_INPUT"
-    if "read timed out" in t or "connection timed out" in t:
+    if ("read timed out" in t or "connection timed out" in t or "circuit open" in t
+            or "deadline exceeded" in t):
         return "DEPENDENCY_TIMEOUT"
     if "access denied" in t or "not authorized" in t:
         return "IAM_ERROR"
@@ -765,9 +2390,44 @@ def classify_failure(text: str) -> str:
 
     return "UNKNOWN_FAILURE"
 
-def build_rundeck_options(rootly_body: Dict[str, Any], mode: str) -> Dict[str, str]:
-    Log.info("Building Rundeck options begin", mode=mode)
-    options: Dict[str, str] = {}
+class CustomFieldIndex:
+    """Custom fields of one event, normalized once and keyed by `_norm_key(slug)`.
+
+    The first field whose slug normalizes to a given key wins, matching the
+    linear scan in `_cf_value_from_root`.
+    """
+
+    def __init__(self, cf_map: Dict[str, str]):
+        self.fields = cf_map
+        self.by_norm: Dict[str, str] = {}
+        for k, v in cf_map.items():
+            self.by_norm.setdefault(_norm_key(k), v)
+
+    @classmethod
+    def from_body(cls, rootly_body: Dict[str, Any]) -> "CustomFieldIndex":
+        data = (rootly_body or {}).get("data") or {}
+        return cls(normalize_custom_fields(data.get("custom_fields")))
+
+    def get(self, norm_slug: str) -> Any:
+        return self.by_norm.get(norm_slug)
+
+
+# (mode, config version) -> [(source path, option key, normalized cf slug or None)]
+_OPTION_PLANS: Dict[tuple, List[tuple]] = {}
+# Batch workers and the fan-out pool compile plans concurrently; eviction must not race a lookup/insert
+_OPTION_PLANS_LOCK = threading.Lock()
+
+
+def _option_plan(mode: str) -> List[tuple]:
+    """Compile the merged option map for `mode` into accessor steps.
+
+    Recompiled only when AppConfig bumps the config version. Custom-field
+    paths carry their normalized slug so extraction is a dict lookup.
+    """
+    cache_key = (mode, _APPCONFIG_CACHE["version"])
+    plan = _OPTION_PLANS.get(cache_key)
+    if plan is not None:
+        return plan
 
     # Choose base defaults by mode
     base_map = (Config.DIAGNOSIS_DEFAULT_OPTION_MAP
@@ -782,18 +2442,44 @@ def build_rundeck_options(rootly_body: Dict[str, Any], mode: str) -> Dict[str, s
             override_keys=list(Config.RUNDECK_OPTION_MAP.keys()),
             mode=mode)
 
+    plan = []
     for src, dest in option_map.items():
-        val = _get_by_path(rootly_body, src)
+        cf_slug: Optional[str] = None
+        if isinstance(src, str):
+            parts = src.split(".")
+            if len(parts) >= 3 and parts[0] == "data" and parts[1] == "custom_fields":
+                slug_like = ".".join(parts[2:])
+                if not slug_like:
+                    continue
+                cf_slug = _norm_key(slug_like.replace("-", "_"))
+        plan.append((src, _sanitize(dest), cf_slug))
+
+    # Drop plans compiled for older config versions
+    with _OPTION_PLANS_LOCK:
+        for k in [k for k in _OPTION_PLANS if k[1] != cache_key[1]]:
+            del _OPTION_PLANS[k]
+        _OPTION_PLANS[cache_key] = plan
+    return plan
+
+
+@Metrics.timed("options")
+def build_rundeck_options(rootly_body: Dict[str, Any], mode: str,
+                          cf_map: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    Log.info("Building Rundeck options begin", mode=mode)
+    options: Dict[str, str] = {}
+
+    index = (CustomFieldIndex(cf_map) if cf_map is not None
+             else CustomFieldIndex.from_body(rootly_body))
+
+    for src, key, cf_slug in _option_plan(mode):
+        val = index.get(cf_slug) if cf_slug is not None else _get_by_path(rootly_body, src)
         if val is not None:
-            key = _sanitize(dest)
             options[key] = str(val)
             Log.info("Option mapped", source=src, dest=key, mode=mode)
 
     # Pass-through all custom fields if enabled (unchanged)
     if Config.PASS_ALL_CUSTOM_FIELDS:
-        cf_raw = ((rootly_body.get("data") or {}).get("custom_fields"))
-        cf_map = normalize_custom_fields(cf_raw)
-        for slug, val in cf_map.items():
+        for slug, val in index.fields.items():
             key = f"cf_{_sanitize(slug)}"
             if key not in options:
                 options[key] = str(val)
@@ -815,12 +2501,13 @@ def format_for_rootly(cleaned: str, kind: str, auto: bool = False, selector: str
     return f"{header}{sel}\n\n```\n{pretty}\n```\n\n_Processed at {ts}_\n"
 
 
-def format_error_for_rootly(kind: str, details: str, auto: bool = False, selector: str = "") -> str:
+def format_error_for_rootly(kind: str, details: str, auto: bool = False, selector: str = "",
+                            guidance: str = "") -> str:
     """lambd-2 variant: user-facing guidance + error details in code block (no ROUTING:: category)."""
     title = "🚨 Diagnosis / Remediation  Job Failed" 
     if auto:
         title = f"{title} (auto)"
-    guidance = (
+    guidance = guidance or (
         "Rundeck rejected the request (likely a *required option is missing*). "
         "For diagnosis ensure env_orn is set. "
         "For remediation, fill cloud_account, region, and instance_id via the O11 form."
@@ -837,10 +2524,125 @@ def _new_token(suffix: str = "") -> str:
     return f"{Config.MIRROR_TOKEN_PREFIX}_{core}{('_' + suffix) if suffix else ''}"
 
 
-def set_mirror_ready_token(rootly: RootlyClient, incident_id: str, exec_id: str = "") -> bool:
+# =========================
+# Mirror field discovery cache (in-process TTL + DynamoDB)
+# =========================
+_MIRROR_FIELD_CACHE: Dict[str, Any] = {"exp": 0, "field_id": "", "slug": ""}
+
+
+def _mirror_field_cache_key() -> str:
+    return f"mirror_field#{_norm_key(Config.MIRROR_FIELD_NAME)}"
+
+
+def invalidate_mirror_field_cache() -> None:
+    _MIRROR_FIELD_CACHE.update({"exp": 0, "field_id": "", "slug": ""})
+    DDB().delete_cache_entry(_mirror_field_cache_key())
+    Log.info("Mirror field cache invalidated", field_name=Config.MIRROR_FIELD_NAME)
+
+
+def _store_mirror_field(field_id: str, slug: str) -> None:
+    ttl = max(60, Config.MIRROR_FIELD_CACHE_SECONDS)
+    _MIRROR_FIELD_CACHE.update({"exp": time.time() + ttl, "field_id": field_id, "slug": slug})
+    DDB().put_cache_entry(_mirror_field_cache_key(), {"field_id": field_id, "slug": slug}, ttl)
+
+
+def resolve_mirror_field_id(rootly: RootlyClient, refresh: bool = False) -> str:
+    if Config.MIRROR_FIELD_ID:
+        return Config.MIRROR_FIELD_ID
+    if refresh:
+        invalidate_mirror_field_cache()
+    elif _MIRROR_FIELD_CACHE["field_id"] and _MIRROR_FIELD_CACHE["exp"] > time.time():
+        return _MIRROR_FIELD_CACHE["field_id"]
+    else:
+        entry = DDB().get_cache_entry(_mirror_field_cache_key())
+        if entry.get("field_id"):
+            _MIRROR_FIELD_CACHE.update({"exp": time.time() + max(60, Config.MIRROR_FIELD_CACHE_SECONDS),
+                                        "field_id": entry["field_id"], "slug": entry.get("slug", "")})
+            Log.info("Mirror field id loaded from DynamoDB cache", field_id=entry["field_id"])
+            return entry["field_id"]
+
+    field_id = rootly.discover_field_id_by_name(Config.MIRROR_FIELD_NAME)
+    if field_id:
+        _store_mirror_field(field_id, "")
+    return field_id
+
+
+def resolve_mirror_field_slug(rootly: RootlyClient, field_id: str, refresh: bool = False) -> str:
+    if Config.MIRROR_FIELD_SLUG:
+        return Config.MIRROR_FIELD_SLUG
+    if not refresh:
+        if (_MIRROR_FIELD_CACHE["field_id"] == field_id and _MIRROR_FIELD_CACHE["slug"]
+                and _MIRROR_FIELD_CACHE["exp"] > time.time()):
+            return _MIRROR_FIELD_CACHE["slug"]
+        entry = DDB().get_cache_entry(_mirror_field_cache_key())
+        if entry.get("field_id") == field_id and entry.get("slug"):
+            _MIRROR_FIELD_CACHE.update({"exp": time.time() + max(60, Config.MIRROR_FIELD_CACHE_SECONDS),
+                                        "field_id": field_id, "slug": entry["slug"]})
+            return entry["slug"]
+    slug = rootly.get_field_slug(field_id)
+    if slug:
+        _store_mirror_field(field_id, slug)
+    return slug
+
+
+# =========================
+# Mirror selection id cache (in-process LRU + DynamoDB)
+# =========================
+_SELECTION_IDS: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (selection_id, expires_at)
+_SELECTION_IDS_LOCK = threading.Lock()
+
+
+def _selection_cache_key(incident_id: str, field_id: str) -> str:
+    return f"selection#{incident_id}#{field_id}"
+
+
+def cached_selection_id(incident_id: str, field_id: str) -> str:
+    key = _selection_cache_key(incident_id, field_id)
+    with _SELECTION_IDS_LOCK:
+        hit = _SELECTION_IDS.get(key)
+        if hit and hit[1] > time.time():
+            _SELECTION_IDS.move_to_end(key)
+            return hit[0]
+    sel_id = DDB().get_cache_entry(key).get("selection_id", "")
+    if sel_id:
+        _remember_selection_local(key, sel_id)
+        Log.info("Selection id loaded from DynamoDB cache", selection_id=sel_id)
+    return sel_id
+
+
+def _remember_selection_local(key: str, sel_id: str) -> None:
+    with _SELECTION_IDS_LOCK:
+        _SELECTION_IDS[key] = (sel_id, time.time() + max(60, Config.SELECTION_CACHE_SECONDS))
+        _SELECTION_IDS.move_to_end(key)
+        while len(_SELECTION_IDS) > max(1, Config.SELECTION_CACHE_MAX_ENTRIES):
+            _SELECTION_IDS.popitem(last=False)
+
+
+def remember_selection_id(incident_id: str, field_id: str, sel_id: str) -> None:
+    key = _selection_cache_key(incident_id, field_id)
+    _remember_selection_local(key, sel_id)
+    DDB().put_cache_entry(key, {"selection_id": sel_id}, max(60, Config.SELECTION_CACHE_SECONDS))
+
+
+def forget_selection_id(incident_id: str, field_id: str) -> None:
+    key = _selection_cache_key(incident_id, field_id)
+    with _SELECTION_IDS_LOCK:
+        _SELECTION_IDS.pop(key, None)
+    DDB().delete_cache_entry(key)
+
+
+@Metrics.timed("mirror_token")
+def set_mirror_ready_token(rootly: RootlyClient, incident_id: str, exec_id: str = "",
+                           after: tuple = ()) -> bool:
+    """
+    Write a fresh mirror-ready token on the incident. Field discovery and the
+    selection lookup run right away; the write itself waits for the `after`
+    futures (e.g. the results post), so the token never lands first.
+    """
     Log.info("Setting mirror ready token begin", incident_id=incident_id, exec_suffix=(exec_id or "")[:24])
-    field_id = Config.MIRROR_FIELD_ID or rootly.discover_field_id_by_name(Config.MIRROR_FIELD_NAME)
+    field_id = resolve_mirror_field_id(rootly)
     if not field_id:
+        _wait(after)
         rootly.post_incident_event(incident_id, ":warning: Mirror token aborted: custom field id could not be determined.")
         Log.warn("Mirror field id missing; aborting")
         return False
@@ -848,25 +2650,59 @@ def set_mirror_ready_token(rootly: RootlyClient, incident_id: str, exec_id: str
     token = _new_token(exec_id)
     Log.info("Mirror token generated", length=len(token))
 
-    try:
-        sel_id = rootly.list_incident_field_selections(incident_id, field_id)
+    def lookup_selection(fid: str) -> tuple[str, bool]:
+        """(selection id, came from cache)"""
+        sel_id = cached_selection_id(incident_id, fid)
+        if sel_id:
+            return sel_id, True
+        sel_id = rootly.list_incident_field_selections(incident_id, fid) or ""
+        if sel_id:
+            remember_selection_id(incident_id, fid, sel_id)
+        return sel_id, False
+
+    def write_selection(fid: str, sel_id: str, cached: bool) -> int:
         if sel_id:
             st = rootly.patch_selection_value(sel_id, token)
-            Log.info("Selection PATCH", status=st, selection_id=sel_id)
-            ok = 200 <= st < 300
-        else:
-            stc = rootly.create_selection(incident_id, field_id, token)
-            Log.info("Selection CREATE (no existing)", status=stc)
-            ok = 200 <= stc < 300
+            Log.info("Selection PATCH", status=st, selection_id=sel_id, cached=cached)
+            if st != 404 or not cached:
+                return st
+            # Cached id went stale (selection deleted): fall back to list-and-create
+            forget_selection_id(incident_id, fid)
+            sel_id = rootly.list_incident_field_selections(incident_id, fid) or ""
+            if sel_id:
+                remember_selection_id(incident_id, fid, sel_id)
+                return write_selection(fid, sel_id, False)
+        st, new_id = rootly.create_selection(incident_id, fid, token)
+        Log.info("Selection CREATE (no existing)", status=st)
+        if new_id:
+            remember_selection_id(incident_id, fid, new_id)
+        return st
 
-        if ok:
+    try:
+        sel_id, cached = lookup_selection(field_id)
+        _wait(after)
+        st = write_selection(field_id, sel_id, cached)
+        if st in (404, 422) and not Config.MIRROR_FIELD_ID:
+            # Field may have been renamed/recreated: rediscover once and retry
+            fresh = resolve_mirror_field_id(rootly, refresh=True)
+            if fresh and fresh != field_id:
+                Log.info("Mirror field id changed; retrying selection write", old=field_id, new=fresh)
+                field_id = fresh
+                st = write_selection(field_id, *lookup_selection(field_id))
+
+        if 200 <= st < 300:
             Log.info("Mirror token write completed (selection)")
             return True
 
-        slug = rootly.get_field_slug(field_id)
+        slug = resolve_mirror_field_slug(rootly, field_id)
         if slug:
             st2 = rootly.patch_incident_custom_fields(incident_id, slug, token)
             Log.info("Fallback custom_fields PATCH", status=st2, slug=slug)
+            if st2 in (404, 422) and not Config.MIRROR_FIELD_SLUG:
+                fresh_slug = resolve_mirror_field_slug(rootly, field_id, refresh=True)
+                if fresh_slug and fresh_slug != slug:
+                    st2 = rootly.patch_incident_custom_fields(incident_id, fresh_slug, token)
+                    Log.info("Fallback custom_fields PATCH (refreshed slug)", status=st2, slug=fresh_slug)
             return 200 <= st2 < 300
 
         Log.warn("Mirror token fallback skipped; slug not available")
@@ -874,10 +2710,83 @@ def set_mirror_ready_token(rootly: RootlyClient, incident_id: str, exec_id: str
 
     except Exception as e:
         Log.warn("Mirror token write error", err=str(e))
+        _wait(after)
         rootly.post_incident_event(incident_id, f":warning: Mirror token write error: {e}")
         return False
 
 
+# =========================
+# Rundeck job option preflight (schema cached per job id)
+# =========================
+_JOB_SCHEMAS: Dict[str, tuple] = {}  # job_id -> (schema, expires_at)
+
+
+def _job_schema_cache_key(job_id: str) -> str:
+    return f"job_schema#{job_id}"
+
+
+def job_option_schema(rundeck: RundeckClient, job_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Cached option schema (in-process, then DynamoDB, then Rundeck); None when unavailable."""
+    hit = _JOB_SCHEMAS.get(job_id)
+    if hit and hit[1] > time.time():
+        return hit[0]
+    ttl = max(30, Config.JOB_SCHEMA_CACHE_SECONDS)
+    entry = DDB().get_cache_entry(_job_schema_cache_key(job_id))
+    if entry.get("schema"):
+        try:
+            schema = json.loads(entry["schema"])
+            # keep the shared entry's expiry; a fresh TTL would outlive it in warm containers
+            _JOB_SCHEMAS[job_id] = (schema, min(time.time() + ttl, float(entry["ttl"])))
+            return schema
+        except ValueError:
+            pass
+    try:
+        schema = rundeck.get_job_options(job_id)
+    except Exception as e:
+        Log.warn("Rundeck job options fetch failed; skipping job preflight", job_id=job_id, err=str(e))
+        _JOB_SCHEMAS[job_id] = (None, time.time() + min(ttl, 60))  # brief negative cache, in-process only
+        return None
+    _JOB_SCHEMAS[job_id] = (schema, time.time() + ttl)
+    DDB().put_cache_entry(_job_schema_cache_key(job_id), {"schema": json.dumps(schema)}, ttl)
+    return schema
+
+
+def forget_job_option_schema(job_id: str) -> None:
+    _JOB_SCHEMAS.pop(job_id, None)
+    DDB().delete_cache_entry(_job_schema_cache_key(job_id))
+
+
+def validate_job_options(schema: Dict[str, Dict[str, Any]], options: Dict[str, str]) -> tuple[List[str], List[str]]:
+    """
+    Check options the way Rundeck does at run time. Returns (missing required
+    option names, "name: reason" for enforced-values / regex violations).
+    """
+    missing: List[str] = []
+    invalid: List[str] = []
+    for name, spec in schema.items():
+        val = str(options.get(name, "")).strip()
+        if not val:
+            if spec.get("required") and not spec.get("default"):
+                missing.append(name)
+            continue
+        parts = ([p.strip() for p in val.split(spec.get("delimiter") or ",")]
+                 if spec.get("multivalued") else [val])
+        if spec.get("enforced") and spec.get("values"):
+            bad = [p for p in parts if p not in spec["values"]]
+            if bad:
+                invalid.append(f"{name}: {', '.join(bad)} not in allowed values ({', '.join(spec['values'][:20])})")
+                continue
+        if spec.get("regex"):
+            try:
+                rx = re.compile(spec["regex"])
+            except re.error:
+                continue  # Rundeck would have refused to save the job; don't second-guess it
+            bad = [p for p in parts if not rx.fullmatch(p)]
+            if bad:
+                invalid.append(f"{name}: '{bad[0][:80]}' does not match /{spec['regex']}/")
+    return missing, invalid
+
+
 # =========================
 # Timeline Note Dedupe Helper
 # =========================
@@ -890,6 +2799,38 @@ def post_incident_event_once(rootly: RootlyClient, ddb: DDB, incident_id: str, g
     Log.info("Note suppressed by rem guard", pk=key)
     return False
 
+def post_failure_once(rootly: RootlyClient, ddb: DDB, incident_id: str, note_key: str, message: str,
+                    mirror_key: str, mirror_suffix: str, note_ttl: Optional[int] = None,
+                    routing_category: str = "") -> None:
+    """
+    Error-path fan-out: timeline note and mirror token, each deduped by its
+    own rem guard. Both guards are resolved in one batch call; the optional
+    (unconditional) ROUTING:: event is chained after the note so it never
+    lands first, and the mirror token is written after both.
+    """
+    note_guard = f"note:{note_key}"
+    held = ddb.acquire_rem_guards(incident_id, {note_guard: note_ttl, mirror_key: Config.MIRROR_DEDUPE_TTL})
+    posts = []
+    if held[note_guard]:
+        posts.append(_fanout(rootly.post_incident_event, incident_id, message))
+    else:
+        Log.info("Note suppressed by rem guard", pk=note_guard)
+    if routing_category:
+        # queued behind the note (FIFO pool), so waiting on it cannot starve the pool
+        note = tuple(posts)
+
+        def post_routing():
+            _wait(note)
+            return rootly.post_incident_event(incident_id, f"ROUTING::{routing_category}")
+        posts.append(_fanout(post_routing))
+    # mirror discovery overlaps the posts; the token is written only once both are done
+    try:
+        if held[mirror_key]:
+            set_mirror_ready_token(rootly, incident_id, mirror_suffix, after=tuple(posts))
+    finally:
+        _wait(posts)
+    _join(posts)
+
 def _has(obj: Dict[str, Any], path: str) -> bool:
     return _get_by_path(obj, path) is not None
 
@@ -900,9 +2841,142 @@ def validate_payload(body: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+def _execution_duration_seconds(rundeck: RundeckClient, exec_id: str, state: Dict[str, Any]) -> Optional[float]:
+    """
+    Job runtime from Rundeck's own timestamps: the state endpoint's
+    startTime/endTime, else date-started/date-ended of the execution (the
+    output tail reports neither). None when neither is available; poll
+    wall-clock time only says when the schedule noticed completion.
+    """
+    try:
+        start = datetime.datetime.fromisoformat(str(state["startTime"]).replace("Z", "+00:00"))
+        end = datetime.datetime.fromisoformat(str(state["endTime"]).replace("Z", "+00:00"))
+        return max(0.0, (end - start).total_seconds())
+    except (KeyError, TypeError, ValueError):
+        pass
+    try:
+        execution = rundeck.get_execution(exec_id)
+    except Exception as e:
+        Log.warn("Execution timestamps unavailable", execution_id=exec_id, err=str(e))
+        return None
+    started, ended = _rundeck_unixtime(execution, "date-started"), _rundeck_unixtime(execution, "date-ended")
+    return max(0.0, ended - started) if started and ended else None
+
+
+@Metrics.timed("poll")
+def poll_with_runtime_stats(rundeck: RundeckClient, ddb: DDB, exec_id: str, job_id: str = "",
+                            tail: Optional[OutputTail] = None,
+                            on_progress: Optional[Callable[[OutputTail, float], None]] = None,
+                            started: Optional[float] = None) -> Dict[str, Any]:
+    """poll_until_done scheduled from the job's runtime history; successful runs feed it back."""
+    expected = ddb.get_job_runtime_stats(job_id) if (job_id and Config.POLL_ADAPTIVE) else {}
+    state = rundeck.poll_until_done(exec_id, expected=expected, tail=tail, on_progress=on_progress,
+                                    started=started)
+    if job_id and (state.get("executionState") or "").lower() == "succeeded":
+        seconds = _execution_duration_seconds(rundeck, exec_id, state)
+        if seconds is None:
+            Log.info("Job runtime not recorded (no execution timestamps)", job_id=job_id, execution_id=exec_id)
+        else:
+            ddb.record_job_runtime(job_id, seconds)
+    return state
+
+
 # =========================
-# poll.rundeck handler
+# poll.rundeck / poll.sweep handlers
 # =========================
+def new_output_tail(exec_id: str) -> Optional[OutputTail]:
+    return OutputTail(exec_id) if Config.POLL_TAIL_OUTPUT else None
+
+
+def progress_poster(rootly: RootlyClient, incident_id: str, selector: str) -> Callable[[OutputTail, float], None]:
+    """on_progress callback posting a short snippet of the latest log lines to the timeline."""
+    def post(tail: OutputTail, elapsed: float) -> None:
+        snippet = "\n".join(tail.recent) or "(no new output)"
+        sel = f"\n_Selector: {selector}_" if selector else ""
+        rootly.post_incident_event(
+            incident_id,
+            f"*⏳ Rundeck job still running ({int(elapsed)}s)*{sel}\n\n```\n{snippet[:2000]}\n```\n"
+        )
+        tail.recent = []
+    return post
+
+
+def post_execution_result(rootly: RootlyClient, ddb: DDB, incident_id: str, exec_id: str,
+                        mode: str, selector: str, rundeck: RundeckClient,
+                        tail: Optional[OutputTail] = None, mirror_key: str = "") -> None:
+    """Post the job results; the mirror guard and field lookup overlap the post, the token write follows it."""
+    raw = rundeck.fetch_output(exec_id, tail=tail)
+    formatted = format_for_rootly(raw, mode, auto=("auto:" in selector), selector=selector)
+    posted = _fanout(rootly.post_incident_event, incident_id, formatted)
+
+    try:
+        if ddb.acquire_rem_guard(incident_id, mirror_key or f"mirror:poll:{exec_id}",
+                                 ttl_seconds=Config.MIRROR_DEDUPE_TTL):
+            set_mirror_ready_token(rootly, incident_id, str(exec_id), after=(posted,))
+    finally:
+        _wait([posted])
+    _join([posted])
+
+
+def invoke_async_poll(function_name: str, data: Dict[str, Any]) -> None:
+    payload = {"event": {"type": "poll.rundeck"}, "data": data}
+    if Log.enabled("INFO"):
+        Log.info("Invoking async poll", function=function_name, payload_preview=str(payload)[:300])
+    _aws_client("lambda").invoke(
+        FunctionName=function_name,
+        InvocationType="Event",
+        Payload=json.dumps(payload).encode("utf-8")
+    )
+    Log.info("Async poll invoked")
+
+
+def hand_off_poll(ddb: DDB, data: Dict[str, Any], started: Optional[float] = None) -> str:
+    """
+    Continue polling an execution outside this invocation: the sweep registry
+    if configured, else an async poll.rundeck on ASYNC_POLL_LAMBDA_NAME or
+    this function itself. `data` is a poll.rundeck payload (id, title,
+    execution_id, job_id, mode, selector). Returns "sweep" / "async", or ""
+    if neither worked.
+    """
+    data = {k: v for k, v in data.items() if v}
+    try:
+        if Config.PENDING_EXECUTIONS_TABLE:
+            ddb.register_pending_execution({"execution_id": data.get("execution_id"), "incident_id": data.get("id"),
+                                            "job_id": data.get("job_id"), "mode": data.get("mode"),
+                                            "selector": data.get("selector")})
+            how = "sweep"
+        elif Config.LAMBDA_FUNCTION_NAME or Deadline.function_name:
+            invoke_async_poll(Config.LAMBDA_FUNCTION_NAME or Deadline.function_name,
+                              {**data, "started_at": started})
+            how = "async"
+        else:
+            return ""
+    except Exception as e:
+        Log.warn("Poll hand-off failed", err=str(e), execution_id=data.get("execution_id"))
+        return ""
+    Log.info("Poll handed off", how=how, execution_id=data.get("execution_id"),
+            remaining=round(Deadline.remaining(reserve=False), 2))
+    Metrics.count("poll.handoffs")
+    return how
+
+
+def wait_out_circuit(e: CircuitOpenError) -> None:
+    """Before handing off on an open circuit: sleep through it (deadline permitting) so the next poll does not hit it at once."""
+    wait = min(e.retry_in, Deadline.remaining() - Config.DEADLINE_HANDOFF_SECONDS)
+    if wait > 0:
+        time.sleep(wait)
+
+
+def post_poll_failure(rootly: RootlyClient, ddb: DDB, incident_id: str, exec_id: str,
+                    mode: str, selector: str, err: Exception) -> None:
+    formatted = format_error_for_rootly(mode, str(err), auto=("auto:" in selector), selector=selector)
+    post_failure_once(rootly, ddb, incident_id, "poll_error", formatted,
+                    mirror_key=f"mirror:poll_err:{mode}:{selector or exec_id or 'poll'}",
+                    mirror_suffix=f"poll_error_{mode}",
+                    note_ttl=Config.AUTO_DEDUPE_TTL,
+                    routing_category=classify_failure(str(err)))
+
+
 def handle_poll_rundeck_event(body: Dict[str, Any]) -> Dict[str, Any]:
     rootly = RootlyClient()
     rundeck = RundeckClient()
@@ -913,60 +2987,400 @@ def handle_poll_rundeck_event(body: Dict[str, Any]) -> Dict[str, Any]:
     exec_id = (data.get("execution_id") or "").strip()
     mode = (data.get("mode") or "diagnosis").strip() or "diagnosis"
     selector = (data.get("selector") or "").strip()
+    job_id = (data.get("job_id") or "").strip()
+    try:
+        started = float(data.get("started_at") or 0) or None
+    except (TypeError, ValueError):
+        started = None
 
+    Metrics.dimension(Mode=mode, Selector=selector)
     if not incident_id or not exec_id:
         Log.warn("poll.rundeck missing inputs", incident_id=incident_id, exec_id=exec_id)
         return _response(200, "ignored_poll_missing_inputs")
 
     try:
-        rundeck.poll_until_done(exec_id)
-        raw = rundeck.fetch_output(exec_id)
-        formatted = format_for_rootly(raw, mode, auto=("auto:" in selector), selector=selector)
-        rootly.post_incident_event(incident_id, formatted)
-
-        if ddb.acquire_rem_guard(incident_id, f"mirror:poll:{exec_id}", ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-            set_mirror_ready_token(rootly, incident_id, str(exec_id))
-
+        tail = new_output_tail(exec_id)
+        poll_with_runtime_stats(rundeck, ddb, exec_id, job_id, tail=tail,
+                                on_progress=progress_poster(rootly, incident_id, selector), started=started)
+        post_execution_result(rootly, ddb, incident_id, exec_id, mode, selector, rundeck, tail=tail)
         return _response(200, "poll_posted", incident_id=incident_id, execution_id=str(exec_id), mode=mode)
     except Exception as e:
+        # Out of time, or an upstream circuit is open: the execution is not done with, keep polling elsewhere
+        if isinstance(e, (DeadlineExceeded, CircuitOpenError)):
+            if isinstance(e, CircuitOpenError):
+                wait_out_circuit(e)
+            how = hand_off_poll(ddb, {"id": incident_id, "title": data.get("title"), "execution_id": exec_id,
+                                      "job_id": job_id, "mode": mode, "selector": selector},
+                                started=getattr(e, "started", None) or started)
+            if how:
+                return _response(200, "poll_handed_off", incident_id=incident_id, execution_id=str(exec_id),
+                                mode=mode, handoff=how)
         Log.error("poll.rundeck failed", err=str(e), exec_id=exec_id, incident_id=incident_id)
-        formatted = format_error_for_rootly(mode, str(e), auto=("auto:" in selector), selector=selector)
-        post_incident_event_once(rootly, ddb, incident_id, "poll_error", formatted,
-                                ttl_seconds=Config.AUTO_DEDUPE_TTL)
-        failure_category = classify_failure(str(e))
-        rootly.post_incident_event(
-            incident_id,
-            f"ROUTING::{failure_category}"
-        )
-        guard = f"mirror:poll_err:{mode}:{selector or exec_id or 'poll'}"
-        if ddb.acquire_rem_guard(incident_id, guard, ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-            set_mirror_ready_token(rootly, incident_id, f"poll_error_{mode}")
+        post_poll_failure(rootly, ddb, incident_id, exec_id, mode, selector, e)
         return _response(200, "poll_failed_but_mirrored", incident_id=incident_id, error=str(e), mode=mode)
 
 
+def _rundeck_unixtime(execution: Dict[str, Any], field: str) -> Optional[float]:
+    try:
+        return float((execution.get(field) or {})["unixtime"]) / 1000.0
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def handle_poll_sweep_event(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Scheduled sweep over every registered pending execution: one bulk
+    running-executions query, then only completed (or expired) executions
+    are claimed and finalized. Nothing sleeps.
+    """
+    if not Config.PENDING_EXECUTIONS_TABLE:
+        Log.warn("poll.sweep received but PENDING_EXECUTIONS_TABLE not set")
+        return _response(200, "ignored_sweep_not_configured")
+
+    rootly = RootlyClient()
+    rundeck = RundeckClient()
+    ddb = DDB()
+
+    pending = ddb.scan_pending_executions()
+    if not pending:
+        return _response(200, "sweep_idle", pending=0)
+    running = rundeck.list_running_execution_ids()
+
+    now = time.time()
+    finished, waiting, expired, retrying = 0, 0, 0, 0
+    deferred = 0
+    for rec in pending:
+        if Deadline.remaining() < Config.DEADLINE_HANDOFF_SECONDS:
+            # unclaimed records stay registered for the next sweep
+            deferred += 1
+            continue
+        exec_id = rec.get("execution_id") or ""
+        incident_id = rec.get("incident_id") or ""
+        mode = rec.get("mode") or "diagnosis"
+        selector = rec.get("selector") or ""
+        job_id = rec.get("job_id") or ""
+        age = now - float(rec.get("created") or now)
+        claimed = False
+        try:
+            if exec_id in running:
+                if age < Config.SWEEP_MAX_AGE_SECONDS:
+                    waiting += 1
+                    continue
+                if ddb.claim_pending_execution(exec_id):
+                    claimed = True
+                    expired += 1
+                    raise TimeoutError(f"Rundeck execution {exec_id} not complete within timeout")
+                continue
+
+            execution = rundeck.get_execution(exec_id)
+            status = (execution.get("status") or "").lower()
+            if status in ("running", "scheduled", "queued"):
+                waiting += 1
+                continue
+            if not ddb.claim_pending_execution(exec_id):
+                continue
+            claimed = True
+            started, ended = _rundeck_unixtime(execution, "date-started"), _rundeck_unixtime(execution, "date-ended")
+            if job_id and status == "succeeded" and started and ended:
+                ddb.record_job_runtime(job_id, max(0.0, ended - started))
+            post_execution_result(rootly, ddb, incident_id, exec_id, mode, selector, rundeck)
+            finished += 1
+        except Exception as e:
+            if isinstance(e, CircuitOpenError):
+                # Upstream unavailable, not an execution failure: keep (or put back) the record for the next sweep
+                Log.warn("poll.sweep deferred (circuit open)", err=str(e), exec_id=exec_id, claimed=claimed)
+                if claimed:
+                    try:
+                        ddb.register_pending_execution({k: rec.get(k) for k in
+                                                        ("execution_id", "incident_id", "job_id", "mode", "selector")})
+                    except Exception as re_err:
+                        Log.error("Pending execution re-registration failed", err=str(re_err), exec_id=exec_id)
+                retrying += 1
+                continue
+            # Unclaimed records are retried by the next sweep; only a claimed (or expired) one is reported
+            if not claimed:
+                if age < Config.SWEEP_MAX_AGE_SECONDS or not ddb.claim_pending_execution(exec_id):
+                    Log.warn("poll.sweep check failed; retrying next sweep", err=str(e), exec_id=exec_id)
+                    retrying += 1
+                    continue
+                expired += 1
+            Log.error("poll.sweep execution failed", err=str(e), exec_id=exec_id, incident_id=incident_id)
+            if incident_id:
+                try:
+                    post_poll_failure(rootly, ddb, incident_id, exec_id, mode, selector, e)
+                except Exception as pe:
+                    Log.error("poll.sweep failure post failed", err=str(pe), exec_id=exec_id,
+                             incident_id=incident_id)
+
+    if deferred:
+        Log.warn("poll.sweep stopped at deadline", deferred=deferred)
+    return _response(200, "sweep_done", pending=len(pending), finished=finished,
+                    waiting=waiting, expired=expired, retrying=retrying, deferred=deferred)
+
+
 # =========================
 # Lambda handler
 # =========================
+# self-addressed events that carry no Rootly incident payload
+INTERNAL_EVENT_TYPES = ("poll.rundeck", "poll.sweep")
+
+
+def route_event(body: Dict[str, Any], cf_map: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Pure routing for a Rootly webhook body: which job runs, in which mode and
+    under which dedupe guard. No I/O, logging included (see _log_route); the
+    handler performs the side effects for each outcome ("" = routable,
+    "unknown_watch", "missing_job_key", "unknown_job_key", "ignored_event").
+    """
+    evt_type = ((body.get('event') or {}).get('type')) or ""
+    data = body.get('data') or {}
+    if cf_map is None:
+        cf_map = normalize_custom_fields(data.get('custom_fields'))
+
+    route: Dict[str, Any] = {"evt_type": evt_type, "incident_id": (data.get('id') or "").strip(),
+                             "outcome": "", "auto": False, "selector": "", "job_id": "", "mode": "",
+                             "guard_key": ""}
+
+    # Auto diagnosis routing based on watch_id
+    watch_raw = (cf_map.get('watch_id') or '').strip()
+    watch_key = route["watch_key"] = _norm_key(watch_raw) if watch_raw else ""
+
+    # Manual remediation selection
+    manual_key_raw = (cf_map.get('o11_remediation_job')
+            or cf_map.get('o11_diagnosis_job')
+            or '').strip()
+    manual_key = route["manual_key"] = _norm_key(manual_key_raw) if manual_key_raw else ""
+    route["manual_raw"] = manual_key_raw
+
+    if evt_type in ("incident.created", "auto.diagnosis"):
+        if watch_key and watch_key in Config.WATCH_TO_DIAG_MAP:
+            route.update(job_id=Config.WATCH_TO_DIAG_MAP[watch_key], mode="diagnosis", auto=True,
+                         selector=f"auto:watch:{watch_key}")
+        else:
+            route["outcome"] = "unknown_watch"
+
+    elif evt_type == "workflow.run":
+        if not manual_key:
+            route["outcome"] = "missing_job_key"
+        elif manual_key in Config.REMEDIATION_JOB_ID_MAP:
+            route.update(mode="remediation", job_id=Config.REMEDIATION_JOB_ID_MAP[manual_key])
+        elif manual_key in Config.DIAGNOSIS_JOB_ID_MAP:
+            route.update(mode="diagnosis", job_id=Config.DIAGNOSIS_JOB_ID_MAP[manual_key])
+        else:
+            route["outcome"] = "unknown_job_key"
+        if route["job_id"]:
+            route["selector"] = f"manual:{route['mode']}:{manual_key}"
+
+    else:
+        route["outcome"] = "ignored_event"
+
+    if route["job_id"]:
+        route["guard_key"] = route["selector"] or f"{route['mode']}:{manual_key or watch_key or 'unknown'}"
+    return route
+
+
+def _log_route(route: Dict[str, Any]) -> None:
+    """The routing decision, logged by the handler in the event's own log context."""
+    evt_type, outcome = route["evt_type"], route["outcome"]
+    if evt_type in ("incident.created", "auto.diagnosis"):
+        if outcome == "unknown_watch":
+            Log.info("Auto diagnosis skipped (unknown or missing watch_id)", watch_id=route["watch_key"] or "(none)")
+        else:
+            Log.info("Auto diagnosis selected", watch_id=route["watch_key"], job_id=route["job_id"])
+    elif evt_type == "workflow.run":
+        Log.info("Manual job selection parsed", raw=route["manual_raw"], normalized=route["manual_key"])
+        if outcome == "missing_job_key":
+            Log.info("Missing O11 Remediation Job key; ignoring cleanly", incident_id=route["incident_id"])
+        elif outcome == "unknown_job_key":
+            Log.warn("Job key not found", key=route["manual_key"])
+        else:
+            Log.info("Manual job identity resolved", mode=route["mode"], job_id=route["job_id"],
+                    selector=route["selector"])
+    else:
+        Log.info("Ignored event", evt_type=evt_type or "(none)")
+
+
 def _response(code: int, status: str, **k):
     Log.info("Responding", status_code=code, status=status, extra=k)
+    Metrics.prop(status=status, status_code=code)
     return {"statusCode": code, "body": json.dumps({"status": status, **k})}
 
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    Log.info("Lambda invoked", has_body=('body' in (event or {})))
+# =========================
+# Batch ingestion (SQS / Kinesis)
+# =========================
+_BATCH_POOL = None
+_BATCH_POOL_LOCK = threading.Lock()
+
+
+def _record_id(record: Dict[str, Any]) -> str:
+    """batchItemFailures identifier: SQS messageId or Kinesis sequence number."""
+    if "kinesis" in record:
+        return str((record.get("kinesis") or {}).get("sequenceNumber") or "")
+    return str(record.get("messageId") or "")
+
+
+def _record_event(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn a queue record into the single-event shape lambda_handler takes. The
+    payload may be the raw Rootly webhook body or a whole API Gateway event.
+    """
+    if "kinesis" in record:
+        import base64
+        raw = base64.b64decode((record.get("kinesis") or {}).get("data") or b"").decode("utf-8")
+    else:
+        raw = record.get("body")
+    payload = json.loads(raw) if isinstance(raw, str) else raw
+    if not isinstance(payload, dict):
+        raise ValueError("record payload is not a JSON object")
+    return payload if "body" in payload else {"body": payload}
+
+
+def _coalesce_key(event: Dict[str, Any]) -> tuple:
+    """
+    (key, route) for in-batch dedupe. Webhooks that route to the same
+    (incident, guard key) would race for the same rem guard, so only one of
+    them needs to reach DynamoDB/Rundeck; the routing-error outcomes are
+    grouped the same way since their notes are guarded per incident.
+    """
+    body = _extract_body(event)
+    evt_type = (body.get("event") or {}).get("type") if body else None
+    if not body or evt_type in INTERNAL_EVENT_TYPES or validate_payload(body):
+        return None, None
+    route = route_event(body)
+    if not route["incident_id"]:
+        return None, route
+    if route["guard_key"]:
+        return (route["incident_id"], route["guard_key"]), route
+    if route["outcome"] in ("unknown_watch", "unknown_job_key"):
+        return (route["incident_id"], route["outcome"]), route
+    return None, route
+
+
+def _handle_record(record: Dict[str, Any], context: Any, prepared: Optional[tuple] = None) -> bool:
+    """prepared: (event, route) from the coalescing pass, or (None, parse error)."""
+    rid = _record_id(record)
+    if Deadline.remaining() < Config.DEADLINE_HANDOFF_SECONDS:
+        # not started: report it failed so the event source redelivers it
+        Log.warn("Batch record deferred at deadline", record_id=rid)
+        Metrics.count("batch.deferred")
+        return False
+    try:
+        with Metrics.batch_record():
+            if prepared is None:
+                resp = _handle_event(_record_event(record), context, config_applied=True)
+            elif prepared[0] is None:
+                raise prepared[1]
+            else:
+                resp = _handle_event(prepared[0], context, route=prepared[1], config_applied=True)
+    except Exception as e:
+        Log.error("Batch record failed", record_id=rid, err=str(e))
+        return False
+    # 500 = unhandled exception inside the handler; everything else (incl. ignored/duplicate) is done
+    if int(resp.get("statusCode") or 0) >= 500:
+        Log.warn("Batch record failed", record_id=rid, status_code=resp.get("statusCode"))
+        return False
+    return True
+
+
+def handle_batch(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    SQS / Kinesis event source: route every record through the single-event
+    handler with at most BATCH_CONCURRENCY in flight, and report only the
+    failed records (ReportBatchItemFailures) so the rest are not redelivered.
+    """
+    global _BATCH_POOL
+    records = [r for r in (event.get("Records") or []) if isinstance(r, dict)]
+    Log.info("Batch received", records=len(records),
+            source=(records[0].get("eventSource") or "") if records else "")
 
-    # AppConfig overrides (if configured)
+    # Routing reads Config, so refresh it once before the coalescing pass
     try:
         apply_appconfig_overrides()
     except Exception as e:
         Log.warn("AppConfig override failed; continuing with in-code defaults", err=str(e))
 
+    # Coalesce: first record per (incident, guard key) is the representative
+    prepared: List[tuple] = []
+    work: List[int] = []
+    seen: Dict[tuple, int] = {}
+    for i, r in enumerate(records):
+        try:
+            ev = _record_event(r)
+            key, route = _coalesce_key(ev)
+        except Exception as e:
+            prepared.append((None, e))
+            work.append(i)
+            continue
+        prepared.append((ev, route))
+        if key is not None and key in seen:
+            rep_id = _record_id(records[seen[key]])
+            Log.info("Coalesced duplicate delivery", record_id=_record_id(r), representative=rep_id,
+                    incident_id=key[0], guard_key=key[1], status="ignored_duplicate")
+            continue
+        if key is not None:
+            seen[key] = i
+        work.append(i)
+    Metrics.count("batch.coalesced", len(records) - len(work))
+
+    ok = [True] * len(records)
+    if Config.BATCH_CONCURRENCY <= 1 or len(work) <= 1:
+        for i in work:
+            ok[i] = _handle_record(records[i], context, prepared[i])
+    else:
+        if _BATCH_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            with _BATCH_POOL_LOCK:
+                if _BATCH_POOL is None:
+                    _BATCH_POOL = ThreadPoolExecutor(max_workers=Config.BATCH_CONCURRENCY,
+                                                     thread_name_prefix="batch")
+        results = _BATCH_POOL.map(lambda i: _handle_record(records[i], context, prepared[i]), work)
+        for i, good in zip(work, results):
+            ok[i] = good
+
+    failures = [{"itemIdentifier": _record_id(r)} for r, good in zip(records, ok) if not good]
+    Metrics.set_dimensions(EventType="batch")
+    Metrics.count("batch.records", len(records))
+    Metrics.count("batch.failures", len(failures))
+    Metrics.prop(status="batch_done", records=len(records), failures=len(failures))
+    Log.info("Batch done", records=len(records), failures=len(failures))
+    return {"batchItemFailures": failures}
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    Deadline.start(context)
+    try:
+        with Metrics.span("invocation"):
+            if isinstance(event, dict) and isinstance(event.get("Records"), list):
+                return handle_batch(event, context)
+            return _handle_event(event, context)
+    finally:
+        Metrics.flush()
+        Log.flush()
+
+
+def _handle_event(event: Dict[str, Any], context: Any,
+                  route: Optional[Dict[str, Any]] = None, config_applied: bool = False) -> Dict[str, Any]:
+    """Single webhook / internal event. `route` is a precomputed route_event() result (batch mode);
+    `config_applied` means the caller already applied AppConfig overrides for this event."""
+    Log.info("Lambda invoked", has_body=('body' in (event or {})))
+
+    # AppConfig overrides (if configured). Batch records (routed or not) run against the
+    # snapshot handle_batch applied; re-applying here would change it mid-batch.
+    if not config_applied:
+        try:
+            apply_appconfig_overrides()
+        except Exception as e:
+            Log.warn("AppConfig override failed; continuing with in-code defaults", err=str(e))
+
     Log.info("Env summary (O11)",
             rundeck_url=Config.RUNDECK_URL,
             rundeck_project=Config.RUNDECK_PROJECT,
             ddb_table=Config.DDB_TABLE,
             pass_all_custom_fields=Config.PASS_ALL_CUSTOM_FIELDS,
-            has_lambda_fn=bool(Config.LAMBDA_FUNCTION_NAME))
+            has_lambda_fn=bool(Config.LAMBDA_FUNCTION_NAME),
+            sweep=bool(Config.PENDING_EXECUTIONS_TABLE),
+            **_GUARD_L1.stats())
 
     try:
         rootly = RootlyClient()
@@ -978,12 +3392,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             Log.warn("Empty body; nothing to do")
             return _response(200, "ignored_empty_body")
 
-        err = validate_payload(body) if (body.get("event") or {}).get("type") != "poll.rundeck" else None
+        err = validate_payload(body) if (body.get("event") or {}).get("type") not in INTERNAL_EVENT_TYPES else None
         if err:
             Log.warn("Payload validation failed", reason=err)
             return _response(200, "ignored_invalid_payload", reason=err)
 
-        Log.info("Parsed body", len=len(json.dumps(body)) if body else 0)
+        if Log.enabled("INFO"):
+            Log.info("Parsed body", len=len(json.dumps(body)) if body else 0)
 
         evt_type = ((body.get('event') or {}).get('type')) or ""
         data = body.get('data') or {}
@@ -991,111 +3406,81 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         title = data.get('title', '').strip()
         cf_map = normalize_custom_fields(data.get('custom_fields'))
 
-        if not incident_id and evt_type != "poll.rundeck":
+        if not incident_id and evt_type not in INTERNAL_EVENT_TYPES:
             Log.warn("Missing incident id; ignoring")
             return _response(200, "ignored_missing_incident_id")
 
         Log.info("Event envelope", evt_type=evt_type or "(none)", incident_id=incident_id or "(none)")
+        Metrics.dimension(EventType=evt_type or "(none)")
 
         if evt_type == "poll.rundeck":
             return handle_poll_rundeck_event(body)
+        if evt_type == "poll.sweep":
+            return handle_poll_sweep_event(body)
+
+        route = route or route_event(body, cf_map)
+        _log_route(route)
+        outcome = route["outcome"]
+        watch_key, manual_key = route["watch_key"], route["manual_key"]
+        mode, job_id, selector, auto = route["mode"], route["job_id"], route["selector"], route["auto"]
+
+        if outcome == "unknown_watch":
+            msg = (
+                f"Unrecognized or missing `watch_id` for auto diagnosis. "
+                f"Received: '{watch_key or '(none)'}'. "
+                "You can run a remediation manually via **Trigger O11 Rundeck Job** after filling required inputs."
+            )
+            formatted = format_error_for_rootly("diagnosis", msg, auto=True,
+                                                selector=f"auto:watch:{watch_key or 'none'}")
 
-        auto = False
-        selector = ""
-        job_id = ""
-        mode = ""
-
-        # Auto diagnosis routing based on watch_id
-        watch_raw = (cf_map.get('watch_id') or '').strip()
-        watch_key = _norm_key(watch_raw) if watch_raw else ""
-
-        # Manual remediation selection
-        manual_key_raw = (cf_map.get('o11_remediation_job')
-                or cf_map.get('o11_diagnosis_job')
-                or '').strip()
-        manual_key = _norm_key(manual_key_raw) if manual_key_raw else ""
-
-        if evt_type in ("incident.created", "auto.diagnosis"):
-            if watch_key and watch_key in Config.WATCH_TO_DIAG_MAP:
-                if not ddb.acquire_rem_guard(incident_id, f"gate:auto:{watch_key}", ttl_seconds=Config.AUTO_DEDUPE_TTL):
-                    return _response(200, "auto_already_processed_recently", incident_id=incident_id)
-
-                job_id = Config.WATCH_TO_DIAG_MAP[watch_key]
-                mode = "diagnosis"
-                auto = True
-                selector = f"auto:watch:{watch_key}"
-                Log.info("Auto diagnosis selected", watch_id=watch_key, job_id=job_id)
-            else:
-                Log.info("Auto diagnosis skipped (unknown or missing watch_id)", watch_id=watch_key or "(none)")
-                msg = (
-                    f"Unrecognized or missing `watch_id` for auto diagnosis. "
-                    f"Received: '{watch_key or '(none)'}'. "
-                    "You can run a remediation manually via **Trigger O11 Rundeck Job** after filling required inputs."
-                )
-                formatted = format_error_for_rootly("diagnosis", msg, auto=True,
-                                                    selector=f"auto:watch:{watch_key or 'none'}")
-
-                post_incident_event_once(rootly, ddb, incident_id, "auto_skip_unknown_watch", formatted,
-                                        ttl_seconds=Config.AUTO_DEDUPE_TTL)
-
-                if ddb.acquire_rem_guard(incident_id, "mirror:auto_skip_unknown_watch",
-                                        ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-                    set_mirror_ready_token(rootly, incident_id, "auto_skip_unknown_watch")
-
-                return _response(200, "auto_skip_unknown_watch", incident_id=incident_id, watch_id=watch_key or "(none)")
-
-        elif evt_type == "workflow.run":
-            Log.info("Manual job selection parsed", raw=manual_key_raw, normalized=manual_key)
-            if not manual_key:
-                Log.info("Missing O11 Remediation Job key; ignoring cleanly", incident_id=incident_id)
-                return _response(200, "ignored_empty_or_missing", incident_id=incident_id)
-
-            if manual_key in Config.REMEDIATION_JOB_ID_MAP:
-                mode = "remediation"
-                job_id = Config.REMEDIATION_JOB_ID_MAP[manual_key]
-            elif manual_key in Config.DIAGNOSIS_JOB_ID_MAP:
-                mode = "diagnosis"
-                job_id = Config.DIAGNOSIS_JOB_ID_MAP[manual_key]
-            else:
-                msg = f"Unknown O11 Remediation Job selection '{manual_key}'."
-                Log.warn("Job key not found", key=manual_key)
-                formatted = format_error_for_rootly("diagnosis", msg)
-                post_incident_event_once(rootly, ddb, incident_id, "unknown_job_key", formatted,
-                                        ttl_seconds=Config.AUTO_DEDUPE_TTL)
+            post_failure_once(rootly, ddb, incident_id, "auto_skip_unknown_watch", formatted,
+                            mirror_key="mirror:auto_skip_unknown_watch",
+                            mirror_suffix="auto_skip_unknown_watch",
+                            note_ttl=Config.AUTO_DEDUPE_TTL)
 
-                if ddb.acquire_rem_guard(incident_id, "mirror:unknown_job",
-                                        ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-                    set_mirror_ready_token(rootly, incident_id, "unknown_job")
+            return _response(200, "auto_skip_unknown_watch", incident_id=incident_id, watch_id=watch_key or "(none)")
 
-                return _response(200, "job_not_found_but_mirrored", incident_id=incident_id, job_key=manual_key)
+        if outcome == "missing_job_key":
+            return _response(200, "ignored_empty_or_missing", incident_id=incident_id)
 
-            selector = f"manual:{mode}:{manual_key}"
-            Log.info("Manual job identity resolved", mode=mode, job_id=job_id, selector=selector)
+        if outcome == "unknown_job_key":
+            msg = f"Unknown O11 Remediation Job selection '{manual_key}'."
+            formatted = format_error_for_rootly("diagnosis", msg)
+            post_failure_once(rootly, ddb, incident_id, "unknown_job_key", formatted,
+                            mirror_key="mirror:unknown_job", mirror_suffix="unknown_job",
+                            note_ttl=Config.AUTO_DEDUPE_TTL)
 
-        else:
-            Log.info("Ignored event", evt_type=evt_type or "(none)")
+            return _response(200, "job_not_found_but_mirrored", incident_id=incident_id, job_key=manual_key)
+
+        if outcome == "ignored_event":
             return _response(200, "ignored_event", event_type=evt_type or "(none)")
 
         if not job_id:
             Log.warn("No job_id after routing", evt_type=evt_type, watch_id=watch_key, manual_key=manual_key)
             return _response(200, "no_job_routed", incident_id=incident_id)
 
-        guard_key = selector or f"{mode}:{manual_key or watch_key or 'unknown'}"
-        if not ddb.acquire_rem_guard(incident_id, guard_key, ttl_seconds=Config.AUTO_DEDUPE_TTL if auto else None):
+        Metrics.dimension(Mode=mode, Selector=selector)
+        guard_key = route["guard_key"]
+        guards: Dict[str, Optional[int]] = {guard_key: Config.AUTO_DEDUPE_TTL if auto else None}
+        gate_key = f"gate:auto:{watch_key}" if auto else ""
+        if gate_key:
+            guards = {gate_key: Config.AUTO_DEDUPE_TTL, **guards}
+        held = ddb.acquire_rem_guards(incident_id, guards, all_or_nothing=True)
+        if gate_key and held[gate_key] is False:
+            return _response(200, "auto_already_processed_recently", incident_id=incident_id)
+        if not held[guard_key]:
             return _response(200, "ignored_duplicate", incident_id=incident_id, guard_key=guard_key, mode=mode)
 
         # Build options
         try:
-            options = build_rundeck_options(body, mode)
+            options = build_rundeck_options(body, mode, cf_map=cf_map)
         except Exception as e:
             Log.error("build_rundeck_options error", err=str(e))
             formatted = format_error_for_rootly(mode or "diagnosis", f"options build failure: {e}",
                                                 auto=auto, selector=selector)
-            post_incident_event_once(rootly, ddb, incident_id, "options_build_error", formatted,
-                                    ttl_seconds=Config.AUTO_DEDUPE_TTL if auto else None)
-            if ddb.acquire_rem_guard(incident_id, "mirror:options_build_error",
-                                    ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-                set_mirror_ready_token(rootly, incident_id, "options_build_error")
+            post_failure_once(rootly, ddb, incident_id, "options_build_error", formatted,
+                            mirror_key="mirror:options_build_error", mirror_suffix="options_build_error",
+                            note_ttl=Config.AUTO_DEDUPE_TTL if auto else None)
             return _response(200, "options_build_error", incident_id=incident_id, mode=mode or "diagnosis")
 
         Log.info("Rundeck options built",
@@ -1109,22 +3494,48 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 guidance = f"Missing required options for auto diagnosis: {', '.join(missing)}"
                 Log.warn("Preflight missing options", mode=mode, missing=missing, selector=selector)
                 formatted = format_error_for_rootly(mode, guidance, auto=auto, selector=selector)
-                post_incident_event_once(rootly, ddb, incident_id, "preflight_missing_options", formatted,
-                                        ttl_seconds=Config.AUTO_DEDUPE_TTL)
-                pre_key = f"mirror:preflight:{mode}:{selector or '_'}:{'_'.join(missing)}"
-                if ddb.acquire_rem_guard(incident_id, pre_key, ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-                    set_mirror_ready_token(rootly, incident_id, f"preflight_missing_{mode}_{'_'.join(missing)}")
+                post_failure_once(rootly, ddb, incident_id, "preflight_missing_options", formatted,
+                                mirror_key=f"mirror:preflight:{mode}:{selector or '_'}:{'_'.join(missing)}",
+                                mirror_suffix=f"preflight_missing_{mode}_{'_'.join(missing)}",
+                                note_ttl=Config.AUTO_DEDUPE_TTL)
                 return _response(200, "preflight_validation_error", incident_id=incident_id, mode=mode, missing=missing)
 
+        # Job definition preflight: reject starts Rundeck would refuse
+        schema = job_option_schema(rundeck, job_id) if Config.JOB_PREFLIGHT else None
+        if schema:
+            missing, invalid = validate_job_options(schema, options)
+            if missing or invalid:
+                Log.warn("Preflight rejected options", mode=mode, job_id=job_id, missing=missing,
+                        invalid=invalid, selector=selector)
+                Metrics.count("preflight.rejected")
+                details = "\n".join(
+                    ([f"Missing required options: {', '.join(missing)}"] if missing else [])
+                    + [f"Invalid option {x}" for x in invalid]
+                )
+                fields = sorted(set(missing) | {x.split(":", 1)[0] for x in invalid})
+                guidance = (
+                    f"Rundeck job `{job_id}` would reject these options, so it was not started. "
+                    f"Fix {', '.join(f'*{f}*' for f in fields)} via the O11 form (or the custom fields mapped to them) and retry."
+                )
+                formatted = format_error_for_rootly(mode, details, auto=auto, selector=selector, guidance=guidance)
+                post_failure_once(rootly, ddb, incident_id, "preflight_job_options", formatted,
+                                mirror_key=f"mirror:preflight:{mode}:{selector or '_'}:{'_'.join(fields)}",
+                                mirror_suffix=f"preflight_{mode}_{'_'.join(fields)}",
+                                note_ttl=Config.AUTO_DEDUPE_TTL if auto else None)
+                return _response(200, "preflight_validation_error", incident_id=incident_id, mode=mode,
+                                missing=missing, invalid=[x.split(":", 1)[0] for x in invalid])
+
         # Start Rundeck
         try:
             exec_id = rundeck.start_job(job_id, options)
             Log.info("Rundeck execution started", execution_id=str(exec_id), mode=mode, selector=selector)
-            if not Config.LAMBDA_FUNCTION_NAME:
+            if not Config.LAMBDA_FUNCTION_NAME and not Config.PENDING_EXECUTIONS_TABLE:
                 Log.warn("LAMBDA_FUNCTION_NAME not set; performing inline poll (blocking)")
                 try:
                     # Poll ONCE
-                    state = rundeck.poll_until_done(exec_id)
+                    tail = new_output_tail(exec_id)
+                    state = poll_with_runtime_stats(rundeck, ddb, exec_id, job_id, tail=tail,
+                                                    on_progress=progress_poster(rootly, incident_id, selector))
                     execution_state = (state.get("executionState") or "").lower()
 
                     # Hard fail if job failed
@@ -1132,25 +3543,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         raise RuntimeError(f"RUNDECK_EXECUTION_FAILED::{execution_state}")
 
                     # Fetch output ONLY on success
-                    raw = rundeck.fetch_output(exec_id)
-                    formatted = format_for_rootly(
-                        raw,
-                        mode,
-                        auto=("auto:" in selector),
-                        selector=selector
-                    )
-                    rootly.post_incident_event(incident_id, formatted)
-
-                    if ddb.acquire_rem_guard(
-                        incident_id,
-                        f"mirror:inline:{exec_id}",
-                        ttl_seconds=Config.MIRROR_DEDUPE_TTL
-                    ):
-                        set_mirror_ready_token(rootly, incident_id, str(exec_id))
+                    post_execution_result(rootly, ddb, incident_id, exec_id, mode, selector, rundeck,
+                                        tail=tail, mirror_key=f"mirror:inline:{exec_id}")
 
                     return _response(200, f"{mode}_posted", incident_id=incident_id)
 
                 except Exception as e:
+                    if isinstance(e, (DeadlineExceeded, CircuitOpenError)):
+                        if isinstance(e, CircuitOpenError):
+                            wait_out_circuit(e)
+                        how = hand_off_poll(ddb, {"id": incident_id, "title": title,
+                                                  "execution_id": str(exec_id), "job_id": job_id,
+                                                  "mode": mode, "selector": selector},
+                                            started=getattr(e, "started", None))
+                        if how:
+                            return _response(200, "accepted", incident_id=incident_id,
+                                            execution_id=str(exec_id), mode=mode, handoff=how)
                     Log.error("Inline poll/post error", err=str(e), selector=selector)
 
                     formatted = format_error_for_rootly(
@@ -1160,29 +3568,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         selector=selector
                     )
 
-                    post_incident_event_once(
+                    post_failure_once(
                         rootly,
                         ddb,
                         incident_id,
                         "inline_poll_error",
                         formatted,
-                        ttl_seconds=Config.AUTO_DEDUPE_TTL
-                    )
-
-                    failure_category = classify_failure(str(e))
-                    rootly.post_incident_event(
-                        incident_id,
-                        f"ROUTING::{failure_category}"
+                        mirror_key=f"mirror:inline_err:{mode}:{selector or exec_id or 'inline'}",
+                        mirror_suffix=f"inline_poll_error_{mode}",
+                        note_ttl=Config.AUTO_DEDUPE_TTL,
+                        routing_category=classify_failure(str(e))
                     )
 
-                    inline_key = f"mirror:inline_err:{mode}:{selector or exec_id or 'inline'}"
-                    if ddb.acquire_rem_guard(
-                        incident_id,
-                        inline_key,
-                        ttl_seconds=Config.MIRROR_DEDUPE_TTL
-                    ):
-                        set_mirror_ready_token(rootly, incident_id, f"inline_poll_error_{mode}")
-
                     return _response(
                         200,
                         "poll_failed_but_mirrored",
@@ -1190,37 +3587,74 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         error=str(e),
                         mode=mode
                     )
+            elif Config.PENDING_EXECUTIONS_TABLE:
+                try:
+                    ddb.register_pending_execution({
+                        "execution_id": str(exec_id),
+                        "incident_id": incident_id,
+                        "job_id": job_id,
+                        "mode": mode,
+                        "selector": selector,
+                    })
+                except Exception as e:
+                    # The job is running; without a registry entry nothing would ever poll it
+                    Log.error("Pending execution registration failed", err=str(e), execution_id=str(exec_id))
+                    fn = Config.LAMBDA_FUNCTION_NAME or Deadline.function_name
+                    try:
+                        if not fn:
+                            raise RuntimeError("no async poll function to fall back to")
+                        invoke_async_poll(fn, {"id": incident_id, "title": title, "execution_id": str(exec_id),
+                                               "job_id": job_id, "mode": mode, "selector": selector})
+                        return _response(200, "accepted", incident_id=incident_id, execution_id=str(exec_id),
+                                        mode=mode, handoff="async")
+                    except Exception as inv_err:
+                        Log.error("Async poll fallback failed", err=str(inv_err), execution_id=str(exec_id))
+                    msg = (f"Rundeck execution {exec_id} started, but it could not be registered for polling "
+                           f"({e}); its result will not be posted here. Check the execution in Rundeck.")
+                    post_failure_once(rootly, ddb, incident_id, f"register_failed_{exec_id}",
+                                    format_error_for_rootly(mode, msg, auto=auto, selector=selector,
+                                                            guidance="The job was started but cannot be tracked."),
+                                    mirror_key=f"mirror:register_err:{mode}:{selector or exec_id}",
+                                    mirror_suffix=f"register_error_{mode}",
+                                    note_ttl=Config.AUTO_DEDUPE_TTL if auto else None,
+                                    routing_category=classify_failure(str(e)))
+                    return _response(200, "accepted_untracked", incident_id=incident_id,
+                                    execution_id=str(exec_id), mode=mode, error=str(e))
+                return _response(200, "accepted", incident_id=incident_id, execution_id=str(exec_id), mode=mode)
             else:
                 try:
-                    payload = {
-                        "event": {"type": "poll.rundeck"},
-                        "data":  {
-                            "id": incident_id,
-                            "title": title,
-                            "execution_id": str(exec_id),
-                            "mode": mode,
-                            "selector": selector
-                        }
-                    }
-                    Log.info("Invoking async poll", function=Config.LAMBDA_FUNCTION_NAME, payload_preview=str(payload)[:300])
-                    boto3.client('lambda').invoke(
-                        FunctionName=Config.LAMBDA_FUNCTION_NAME,
-                        InvocationType="Event",
-                        Payload=json.dumps(payload).encode("utf-8")
-                    )
-                    Log.info("Async poll invoked")
+                    invoke_async_poll(Config.LAMBDA_FUNCTION_NAME, {
+                        "id": incident_id,
+                        "title": title,
+                        "execution_id": str(exec_id),
+                        "job_id": job_id,
+                        "mode": mode,
+                        "selector": selector
+                    })
                 except Exception as e:
                     Log.warn("Async poll invoke failed (non-blocking)", err=str(e))
                 return _response(200, "accepted", incident_id=incident_id, execution_id=str(exec_id), mode=mode)
+        except CircuitOpenError as e:
+            Log.error("Rundeck start skipped (circuit open)", err=str(e), selector=selector)
+            formatted = format_error_for_rootly(mode, str(e), auto=auto, selector=selector,
+                                                guidance="Rundeck is failing or unreachable, so the job was not started. Retry once it recovers.")
+            post_failure_once(rootly, ddb, incident_id, "rundeck_circuit_open", formatted,
+                            mirror_key=f"mirror:circuit:{mode}:{selector or '_'}",
+                            mirror_suffix=f"circuit_open_{mode}",
+                            note_ttl=Config.AUTO_DEDUPE_TTL if auto else None,
+                            routing_category=classify_failure(str(e)))
+            return _response(200, "rundeck_circuit_open", incident_id=incident_id, mode=mode,
+                            retry_in=round(e.retry_in, 1))
         except RundeckStartError as e:
             Log.error("Rundeck start failed", code=e.status_code, body=e.body[:400], selector=selector)
+            if e.status_code == 400:
+                forget_job_option_schema(job_id)  # the job definition may have changed under the cache
             guidance = e.body or f"HTTP {e.status_code}: (no body)"
             formatted = format_error_for_rootly(mode, guidance, auto=auto, selector=selector)
-            post_incident_event_once(rootly, ddb, incident_id, f"rundeck_start_{e.status_code}", formatted,
-                                    ttl_seconds=Config.AUTO_DEDUPE_TTL if auto else None)
-            start_key = f"mirror:start:{mode}:{selector or '_'}:{e.status_code}"
-            if ddb.acquire_rem_guard(incident_id, start_key, ttl_seconds=Config.MIRROR_DEDUPE_TTL):
-                set_mirror_ready_token(rootly, incident_id, f"start_{mode}_{e.status_code}")
+            post_failure_once(rootly, ddb, incident_id, f"rundeck_start_{e.status_code}", formatted,
+                            mirror_key=f"mirror:start:{mode}:{selector or '_'}:{e.status_code}",
+                            mirror_suffix=f"start_{mode}_{e.status_code}",
+                            note_ttl=Config.AUTO_DEDUPE_TTL if auto else None)
             return _response(200, "rundeck_start_validation_error", incident_id=incident_id, mode=mode)
 
     except Exception as e:
@@ -1230,15 +3664,16 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             incident_id = ((body or {}).get("data") or {}).get("id") or ""
             if incident_id:
                 formatted = format_error_for_rootly("diagnosis", str(e), auto=False)
+                rootly_e = RootlyClient()
                 try:
-                    post_incident_event_once(RootlyClient(), DDB(), incident_id, "handler_error", formatted,
+                    post_incident_event_once(rootly_e, DDB(), incident_id, "handler_error", formatted,
                                             ttl_seconds=Config.AUTO_DEDUPE_TTL)
                 except Exception:
-                    RootlyClient().post_incident_event(incident_id, formatted)
+                    rootly_e.post_incident_event(incident_id, formatted)
                 try:
                     DDB().acquire_rem_guard(incident_id, "mirror:handler_error",
                                             ttl_seconds=Config.MIRROR_DEDUPE_TTL)
-                    set_mirror_ready_token(RootlyClient(), incident_id, "handler_error")
+                    set_mirror_ready_token(rootly_e, incident_id, "handler_error")
                 except Exception as _e:
                     Log.warn("Mirror attempt after handler error failed", err=str(_e))
         except Exception as _e:
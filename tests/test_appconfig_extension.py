@@ -0,0 +1,107 @@
+"""AppConfig Lambda extension source, against a local HTTP stand-in for the extension."""
+import json
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import lambda_function as lf  # noqa: E402
+
+
+class _Extension(BaseHTTPRequestHandler):
+    document = {}
+    status = 200
+    paths = []
+
+    def do_GET(self):
+        type(self).paths.append(self.path)
+        body = json.dumps(self.document).encode() if self.status == 200 else b"not found"
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def extension():
+    _Extension.document = {"jobs": {"sloToDiagnosis": {"Watch A": "JOB1"}}}
+    _Extension.status = 200
+    _Extension.paths = []
+    server = HTTPServer(("127.0.0.1", 0), _Extension)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def appconfig(monkeypatch, extension):
+    # _apply_appconfig_payload assigns Config attributes directly; restore them afterwards
+    saved = {k: v for k, v in vars(lf.Config).items() if not k.startswith("__")}
+    monkeypatch.setattr(lf, "_APPCONFIG_CACHE",
+                        {"exp": 0, "payload": None, "version": 0, "fetched": 0, "raw": b""})
+    monkeypatch.setattr(lf.Log, "_min_level", lf.Log.LEVELS["ERROR"])
+    lf.Config.APPCONFIG_APP_ID = "app"
+    lf.Config.APPCONFIG_ENV_ID = "prod env"
+    lf.Config.APPCONFIG_PROFILE_ID = "routing"
+    lf.Config.APPCONFIG_SOURCE = "extension"
+    lf.Config.APPCONFIG_EXTENSION_URL = f"http://127.0.0.1:{extension.server_port}"
+    yield
+    for k, v in saved.items():
+        setattr(lf.Config, k, v)
+
+
+def test_first_apply_loads_document():
+    lf.apply_appconfig_overrides()
+
+    assert lf.Config.WATCH_TO_DIAG_MAP == {"watch_a": "JOB1"}
+    assert lf._APPCONFIG_CACHE["version"] == 1
+    assert _Extension.paths == ["/applications/app/environments/prod%20env/configurations/routing"]
+
+
+def test_unchanged_document_is_not_reapplied():
+    lf.apply_appconfig_overrides()
+    lf.apply_appconfig_overrides(force=True)
+
+    assert len(_Extension.paths) == 2
+    assert lf._APPCONFIG_CACHE["version"] == 1
+    assert lf.Config.WATCH_TO_DIAG_MAP == {"watch_a": "JOB1"}
+
+
+def test_changed_document_is_applied():
+    lf.apply_appconfig_overrides()
+    _Extension.document = {"jobs": {"sloToDiagnosis": {"Watch B": "JOB2"}}}
+    lf.apply_appconfig_overrides(force=True)
+
+    assert lf.Config.WATCH_TO_DIAG_MAP == {"watch_b": "JOB2"}
+    assert lf._APPCONFIG_CACHE["version"] == 2
+
+
+def test_http_error_is_raised_and_keeps_config():
+    lf.apply_appconfig_overrides()
+    _Extension.status = 404
+
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        lf.apply_appconfig_overrides(force=True)
+    assert lf.Config.WATCH_TO_DIAG_MAP == {"watch_a": "JOB1"}
+
+
+def test_connection_refused_is_raised():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]  # closed again before the request: nothing listens here
+    lf.Config.APPCONFIG_EXTENSION_URL = f"http://127.0.0.1:{port}"
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        lf.apply_appconfig_overrides()
+    assert lf._APPCONFIG_CACHE["payload"] is None